@@ -13,37 +13,55 @@ This package contains focused modules for different aspects of the system:
 - display_utils: Summary display utilities
 """
 
-from .models import WorkItem, WorkItemType, Priority, ADOInstructions, ORGANIZATION_CONTEXT
-from .config import setup_environment, get_organization_context, get_azure_openai_config, get_environment_info
-from .text_processor import extract_features_from_text, extract_requirements_from_text, determine_priority_from_text
-from .image_processor import process_image_with_azure_openai, load_image_as_base64, get_azure_openai_client, format_image_analysis_result
+from .models import (
+    WorkItem, WorkItemType, Priority, ADOInstructions, ORGANIZATION_CONTEXT,
+    WORK_ITEM_TYPE_BY_VALUE, PRIORITY_BY_VALUE, split_epics_and_tasks
+)
+from .config import (
+    setup_environment, get_organization_context, get_azure_openai_config, log_azure_config_status, get_environment_info
+)
+from .text_processor import (
+    extract_features_from_text, extract_features_from_texts, extract_requirements_from_text, determine_priority_from_text,
+    clear_caches
+)
+from .image_processor import process_image_with_azure_openai, load_image_as_base64, get_azure_openai_client, is_azure_openai_configured, format_image_analysis_result
 from .ado_generator import generate_ado_instructions, format_ado_summary, create_epic_from_feature, create_task_from_requirement
-from .file_search import search_files_for_processing, format_search_results_for_display, get_search_usage_examples
+from .file_search import (
+    search_files_for_processing, format_search_results_for_display, get_search_usage_examples,
+    invalidate_search_cache
+)
 from .error_handling import (
     safe_json_response, safe_operation, handle_import_error, validate_json_structure,
-    safe_file_operation, standardize_error_response, retry_operation, ValidationError
+    safe_file_operation, standardize_error_response, retry_operation, ValidationError, ErrorResponse,
+    OperationError
 )
-from .common_utils import clean_text, extract_action_from_text, safe_json_dumps
+from .common_utils import clean_text, extract_action_from_text, safe_json_dumps, compile_keyword_scanner
 from .display_utils import print_ado_summary, get_quick_stats
 
 __all__ = [
     # Models
     'WorkItem', 'WorkItemType', 'Priority', 'ADOInstructions', 'ORGANIZATION_CONTEXT',
+    'WORK_ITEM_TYPE_BY_VALUE', 'PRIORITY_BY_VALUE', 'split_epics_and_tasks',
     # Configuration
-    'setup_environment', 'get_organization_context', 'get_azure_openai_config', 'get_environment_info',
+    'setup_environment', 'get_organization_context', 'get_azure_openai_config', 'log_azure_config_status',
+    'get_environment_info',
     # Text processing
-    'extract_features_from_text', 'extract_requirements_from_text', 'determine_priority_from_text',
+    'extract_features_from_text', 'extract_features_from_texts', 'extract_requirements_from_text',
+    'determine_priority_from_text', 'clear_caches',
     # Image processing
-    'process_image_with_azure_openai', 'load_image_as_base64', 'get_azure_openai_client', 'format_image_analysis_result',
+    'process_image_with_azure_openai', 'load_image_as_base64', 'get_azure_openai_client', 'is_azure_openai_configured',
+    'format_image_analysis_result',
     # ADO generation
     'generate_ado_instructions', 'format_ado_summary', 'create_epic_from_feature', 'create_task_from_requirement',
     # File search
     'search_files_for_processing', 'format_search_results_for_display', 'get_search_usage_examples',
+    'invalidate_search_cache',
     # Error handling
     'safe_json_response', 'safe_operation', 'handle_import_error', 'validate_json_structure',
-    'safe_file_operation', 'standardize_error_response', 'retry_operation', 'ValidationError',
+    'safe_file_operation', 'standardize_error_response', 'retry_operation', 'ValidationError', 'ErrorResponse',
+    'OperationError',
     # Common utilities
-    'clean_text', 'extract_action_from_text', 'safe_json_dumps',
+    'clean_text', 'extract_action_from_text', 'safe_json_dumps', 'compile_keyword_scanner',
     # Display utilities
     'print_ado_summary', 'get_quick_stats'
 ]
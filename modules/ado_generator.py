@@ -5,26 +5,24 @@ This module contains the core business logic for generating Azure DevOps
 work items from extracted features and requirements.
 """
 
-from typing import List, Dict, Any
+from dataclasses import replace
+from functools import lru_cache
+from typing import List, Dict, Any, Optional
+import re
 import uuid
 
-from .models import WorkItem, ADOInstructions, WorkItemType, Priority, ORGANIZATION_CONTEXT
-from .text_processor import determine_priority_from_text
+from .models import WorkItem, ADOInstructions, WorkItemType, Priority, ORGANIZATION_CONTEXT, split_epics_and_tasks
+from .text_processor import determine_priority_from_text, detect_dependency_chain, extract_features_from_text
+from .common_utils import compile_keyword_scanner
 
 
-def create_epic_from_feature(feature: str, project_name: str = "") -> WorkItem:
-    """Create an Epic work item from a feature description"""
-    
-    # Generate descriptive title
-    if not project_name:
-        project_name = "Project"
-    
-    # Clean up feature name for title
-    feature_clean = feature.replace("Build ", "").replace("Create ", "").replace("Develop ", "")
-    title = f"Epic: {feature_clean}"
-    
-    # Generate description based on feature type
-    description = f"""
+# Requirement text used for each step of a detected dependency chain
+CHAIN_STEP_REQUIREMENT_TEMPLATE = "Implement {} Component"
+
+
+# Markdown description bodies, formatted with the feature or requirement text.
+# Kept at module level so each work item costs a single format call.
+_EPIC_DESCRIPTION_TEMPLATE = """\
 ## Epic Overview
 {feature}
 
@@ -40,36 +38,9 @@ This epic delivers core functionality that aligns with our organization's focus
 ## Dependencies
 - Project infrastructure setup
 - Development environment configuration
-- Required third-party integrations
-    """.strip()
-    
-    # Determine priority
-    priority_level = determine_priority_from_text(feature)
-    priority = Priority.HIGH if priority_level >= 3 else Priority.MEDIUM
-    
-    return WorkItem(
-        id=str(uuid.uuid4()),
-        title=title,
-        work_item_type=WorkItemType.EPIC,
-        description=description,
-        priority=priority,
-        tags=["epic", "feature", project_name.lower().replace(" ", "-")],
-        parent_id=None
-    )
+- Required third-party integrations"""
 
-
-def create_task_from_requirement(requirement: str, epic_id: str, project_name: str = "") -> WorkItem:
-    """Create a Task work item from a requirement"""
-    
-    # Clean up requirement for title
-    requirement_clean = requirement.replace("Need a ", "").replace("Need ", "").replace("Connect to ", "Connect to ")
-    title = f"Task: {requirement_clean}"
-    
-    # Generate detailed description based on requirement type
-    req_lower = requirement.lower()
-    
-    if "database" in req_lower:
-        description = f"""
+_TASK_DATABASE_TEMPLATE = """\
 ## Task Description
 {requirement}
 
@@ -91,11 +62,9 @@ def create_task_from_requirement(requirement: str, epic_id: str, project_name: s
 - Code is reviewed and merged
 - Unit tests are written and passing
 - Documentation is updated
-- Security review is completed
-        """.strip()
-        
-    elif "llm" in req_lower or "ai" in req_lower:
-        description = f"""
+- Security review is completed"""
+
+_TASK_LLM_TEMPLATE = """\
 ## Task Description
 {requirement}
 
@@ -117,11 +86,9 @@ def create_task_from_requirement(requirement: str, epic_id: str, project_name: s
 - Integration tests are passing
 - API documentation is complete
 - Security scan shows no vulnerabilities
-- Performance metrics are within acceptable range
-        """.strip()
-        
-    elif "website" in req_lower or "frontend" in req_lower:
-        description = f"""
+- Performance metrics are within acceptable range"""
+
+_TASK_WEB_TEMPLATE = """\
 ## Task Description
 {requirement}
 
@@ -143,11 +110,9 @@ def create_task_from_requirement(requirement: str, epic_id: str, project_name: s
 - UI/UX review is approved
 - Cross-browser testing is completed
 - Performance audit passes
-- Accessibility audit passes
-        """.strip()
-        
-    else:
-        description = f"""
+- Accessibility audit passes"""
+
+_TASK_GENERIC_TEMPLATE = """\
 ## Task Description
 {requirement}
 
@@ -166,8 +131,122 @@ def create_task_from_requirement(requirement: str, epic_id: str, project_name: s
 ## Definition of Done
 - Code review is completed
 - Tests are written and passing
-- Documentation is updated
-        """.strip()
+- Documentation is updated"""
+
+# Words that make a feature major enough to get its own epic
+MAJOR_FEATURE_KEYWORDS = ('build', 'create', 'develop', 'chatbot', 'website', 'application', 'system', 'platform')
+
+# Leading action verbs dropped from epic titles, and leading "Need"/"Need a" dropped from task titles
+_EPIC_TITLE_PREFIX_RE = re.compile(r'^(?:Build|Create|Develop) ')
+_TASK_TITLE_PREFIX_RE = re.compile(r'^Need (?:a )?')
+
+# Finds any MAJOR_FEATURE_KEYWORDS substring in one pass ("Development" counts as "develop")
+_MAJOR_FEATURE_SCANNER = compile_keyword_scanner(MAJOR_FEATURE_KEYWORDS)
+
+# Keywords that place a requirement in a task category
+TASK_CATEGORY_KEYWORDS = {
+    'database': 'database',
+    'llm': 'llm',
+    'ai': 'llm',
+    'website': 'website',
+    'frontend': 'website',
+    'api': 'api',
+}
+
+# Categories in order of precedence when a requirement mentions several
+TASK_CATEGORY_PRECEDENCE = ('database', 'llm', 'website', 'api')
+
+# Finds every category keyword in a single pass over the requirement
+_TASK_CATEGORY_SCANNER = compile_keyword_scanner(TASK_CATEGORY_KEYWORDS)
+
+# Extra tags for each requirement category (shared, immutable)
+_TASK_CATEGORY_TAGS = {
+    "database": ("database", "backend", "data"),
+    "llm": ("ai", "llm", "integration"),
+    "website": ("frontend", "ui", "web"),
+    "api": ("api", "backend", "integration"),
+}
+
+# Task description template for each requirement category; other
+# categories (and requirements without one) use the generic template
+_TASK_DESCRIPTION_TEMPLATES = {
+    "database": _TASK_DATABASE_TEMPLATE,
+    "llm": _TASK_LLM_TEMPLATE,
+    "website": _TASK_WEB_TEMPLATE,
+}
+
+
+def _new_work_item_id() -> str:
+    """Unique id for a generated work item (32 hex characters, no hyphen formatting)"""
+    return uuid.uuid4().hex
+
+
+@lru_cache(maxsize=256)
+def _project_tag(project_name: str) -> str:
+    """Tag form of a project name (e.g. "Customer Portal" -> "customer-portal"), cached per name"""
+    return project_name.lower().replace(" ", "-")
+
+
+def _task_category(req_lower: str) -> Optional[str]:
+    """Return the highest-precedence category mentioned in a lowercased requirement, if any"""
+    found = {TASK_CATEGORY_KEYWORDS[match.group(1)] for match in _TASK_CATEGORY_SCANNER.finditer(req_lower)}
+    for category in TASK_CATEGORY_PRECEDENCE:
+        if category in found:
+            return category
+    return None
+
+
+def create_epic_from_feature(feature: str, project_name: str = "", project_slug: Optional[str] = None) -> WorkItem:
+    """
+    Create an Epic work item from a feature description
+    
+    Batch callers pass project_slug (the tag form of project_name) so it isn't
+    derived again for every work item; it defaults to the slug of project_name.
+    """
+    if project_slug is None:
+        project_slug = _project_tag(project_name) if project_name else ""
+    
+    # Clean up feature name for title
+    feature_clean = _EPIC_TITLE_PREFIX_RE.sub('', feature, count=1)
+    title = f"Epic: {feature_clean}"
+    
+    # Generate description based on feature type
+    description = _EPIC_DESCRIPTION_TEMPLATE.format(feature=feature)
+    
+    # Determine priority
+    priority_level = determine_priority_from_text(feature)
+    priority = Priority.HIGH if priority_level >= 3 else Priority.MEDIUM
+    
+    return WorkItem(
+        id=_new_work_item_id(),
+        title=title,
+        work_item_type=WorkItemType.EPIC,
+        description=description,
+        priority=priority,
+        tags=["epic", "feature", project_slug or "project"],
+        parent_id=None
+    )
+
+
+def create_task_from_requirement(
+    requirement: str,
+    epic_id: str,
+    project_name: str = "",
+    project_slug: Optional[str] = None
+) -> WorkItem:
+    """Create a Task work item from a requirement (project_slug as in create_epic_from_feature)"""
+    if project_slug is None:
+        project_slug = _project_tag(project_name) if project_name else ""
+    
+    # Clean up requirement for title
+    requirement_clean = _TASK_TITLE_PREFIX_RE.sub('', requirement, count=1)
+    title = f"Task: {requirement_clean}"
+    
+    # Generate detailed description based on requirement type
+    req_lower = requirement.lower()
+    
+    category = _task_category(req_lower)
+    description = _TASK_DESCRIPTION_TEMPLATES.get(category, _TASK_GENERIC_TEMPLATE).format(requirement=requirement)
     
     # Determine priority
     priority_level = determine_priority_from_text(requirement)
@@ -178,22 +257,15 @@ def create_task_from_requirement(requirement: str, epic_id: str, project_name: s
     else:
         priority = Priority.LOW
     
-    # Generate tags based on requirement content
-    tags = ["task"]
-    if project_name:
-        tags.append(project_name.lower().replace(" ", "-"))
-    
-    if "database" in req_lower:
-        tags.extend(["database", "backend", "data"])
-    elif "llm" in req_lower or "ai" in req_lower:
-        tags.extend(["ai", "llm", "integration"])
-    elif "website" in req_lower or "frontend" in req_lower:
-        tags.extend(["frontend", "ui", "web"])
-    elif "api" in req_lower:
-        tags.extend(["api", "backend", "integration"])
+    # Generate tags based on requirement content, built in a single list display
+    category_tags = _TASK_CATEGORY_TAGS.get(category, ())
+    if project_slug:
+        tags = ["task", project_slug, *category_tags]
+    else:
+        tags = ["task", *category_tags]
     
     return WorkItem(
-        id=str(uuid.uuid4()),
+        id=_new_work_item_id(),
         title=title,
         work_item_type=WorkItemType.TASK,
         description=description,
@@ -210,20 +282,24 @@ def generate_work_items_from_features(features: List[str], project_name: str = "
     if not features:
         return work_items
     
+    # Derive the project tag once for every work item in the batch
+    project_slug = _project_tag(project_name) if project_name else ""
+    
     # Check if this is a dependency chain workflow using the text input
     if text_input:
-        from .text_processor import detect_dependency_chain
         chain_info = detect_dependency_chain(text_input)
         
         if chain_info['is_chain']:
             # Create ONE Epic for the workflow root
-            epic = create_epic_from_feature(chain_info['root_concept'], project_name)
+            epic = create_epic_from_feature(chain_info['root_concept'], project_slug=project_slug)
             work_items.append(epic)
             
             # Create Tasks for each step in the dependency chain
-            for step in chain_info['steps']:
-                task = create_task_from_requirement(f"Implement {step} Component", epic.id, project_name)
-                work_items.append(task)
+            step_requirement = CHAIN_STEP_REQUIREMENT_TEMPLATE.format
+            work_items.extend(
+                create_task_from_requirement(step_requirement(step), epic.id, project_slug=project_slug)
+                for step in chain_info['steps']
+            )
             
             return work_items
     
@@ -233,11 +309,8 @@ def generate_work_items_from_features(features: List[str], project_name: str = "
     minor_features = []
     
     for feature in features:
-        feature_lower = feature.lower()
         # Major features that deserve their own epic
-        if any(keyword in feature_lower for keyword in [
-            'build', 'create', 'develop', 'chatbot', 'website', 'application', 'system', 'platform'
-        ]):
+        if _MAJOR_FEATURE_SCANNER.search(feature.lower()):
             major_features.append(feature)
         else:
             minor_features.append(feature)
@@ -245,7 +318,7 @@ def generate_work_items_from_features(features: List[str], project_name: str = "
     # Create epics for major features
     epic_ids = []
     for feature in major_features:
-        epic = create_epic_from_feature(feature, project_name)
+        epic = create_epic_from_feature(feature, project_slug=project_slug)
         work_items.append(epic)
         epic_ids.append(epic.id)
     
@@ -259,7 +332,7 @@ def generate_work_items_from_features(features: List[str], project_name: str = "
     parent_epic_id = epic_ids[0] if epic_ids else None
     for feature in minor_features:
         if parent_epic_id:
-            task = create_task_from_requirement(feature, parent_epic_id, project_name)
+            task = create_task_from_requirement(feature, parent_epic_id, project_slug=project_slug)
             work_items.append(task)
     
     return work_items
@@ -286,12 +359,14 @@ def format_ado_summary(instructions: ADOInstructions) -> str:
     summary.append(f"📋 ADO WORK ITEMS SUMMARY")
     summary.append("=" * 60)
     summary.append(f"🎯 Project: {instructions.project_name}")
-    summary.append(f"🏢 Organization: {instructions.organization_context['name']}")
+    # Generated instructions carry the full context dict; image analysis stores just the name
+    organization = instructions.organization_context
+    organization_name = organization.get('name', '') if isinstance(organization, dict) else organization
+    summary.append(f"🏢 Organization: {organization_name}")
     summary.append("")
     
     # Group work items by type
-    epics = [wi for wi in instructions.work_items if wi.work_item_type.value == "Epic"]
-    tasks = [wi for wi in instructions.work_items if wi.work_item_type.value == "Task"]
+    epics, tasks = split_epics_and_tasks(instructions.work_items)
     
     summary.append(f"📊 OVERVIEW:")
     summary.append(f"   • {len(epics)} Epic(s)")
@@ -348,20 +423,15 @@ def generate_ado_instructions(
     
     # Use provided features or extract from text
     if features is None:
-        from .text_processor import extract_features_from_text
         features = extract_features_from_text(text_input)
     
     # Generate work items (now passing text_input for dependency chain detection)
     work_items = generate_work_items_from_features(features, project_name, text_input)
     
-    # Apply priority override if specified
-    if priority_override:
-        try:
-            override_priority = Priority(priority_override.upper())
-            for work_item in work_items:
-                work_item.priority = override_priority
-        except ValueError:
-            pass  # Invalid priority override, ignore
+    # Apply priority override if specified (matched by name, case-insensitively; invalid values are ignored)
+    override_priority = Priority.__members__.get(priority_override.upper()) if priority_override else None
+    if override_priority is not None:
+        work_items = [replace(work_item, priority=override_priority) for work_item in work_items]
     
     return ADOInstructions(
         project_name=project_name or "Generated Project",
@@ -5,9 +5,32 @@ This module contains shared utility functions to reduce code duplication
 and provide consistent functionality across the application.
 """
 
+import asyncio
+import hashlib
 import json
 import re
-from typing import Any, Optional
+import threading
+from collections import OrderedDict
+from enum import Enum
+from functools import wraps
+from typing import Any, Callable, Iterable, Optional
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # Optional speed-up; the standard library json module is used instead
+
+
+# Runs of whitespace collapsed by clean_text; a lone space is already clean and
+# is not matched, so text that needs no changes is returned without a copy
+_WHITESPACE_RE = re.compile(r'(?: \s|[^\S ])\s*')
+
+# Action patterns tried in order by extract_action_from_text; each captures the action word
+_ACTION_PATTERNS = (
+    re.compile(r'\b(build|create|develop|implement|setup|configure)\b'),
+    re.compile(r'\b(?:want to|need to|should|must)\s+(\w+)'),
+    re.compile(r'\b(design|analyze|test|deploy|monitor)\b'),
+)
 
 
 def clean_text(text: str) -> str:
@@ -23,11 +46,8 @@ def clean_text(text: str) -> str:
     if not text:
         return ""
     
-    # Remove extra whitespace and normalize line endings
-    text = re.sub(r'\s+', ' ', text.strip())
-    text = text.replace('\r\n', '\n').replace('\r', '\n')
-    
-    return text
+    # Collapse all whitespace, line endings included, to single spaces
+    return _WHITESPACE_RE.sub(' ', text.strip())
 
 
 def extract_action_from_text(text: str) -> Optional[str]:
@@ -40,23 +60,146 @@ def extract_action_from_text(text: str) -> Optional[str]:
     Returns:
         Extracted action or None if not found
     """
-    action_patterns = [
-        r'\b(build|create|develop|implement|setup|configure)\b',
-        r'\b(want to|need to|should|must)\s+(\w+)',
-        r'\b(design|analyze|test|deploy|monitor)\b'
-    ]
-    
-    for pattern in action_patterns:
-        match = re.search(pattern, text.lower())
+    text_lower = text.lower()
+    for pattern in _ACTION_PATTERNS:
+        match = pattern.search(text_lower)
         if match:
-            if len(match.groups()) > 1:
-                return match.group(2)  # Return the action word after "want to", etc.
-            else:
-                return match.group(1)  # Return the direct action word
+            return match.group(1)  # The direct action word, or the word after "want to", etc.
     
     return None
 
 
+def run_in_thread(func: Callable) -> Callable:
+    """
+    Decorator that turns a blocking function into a coroutine run in a worker thread
+    
+    Used on CPU- and I/O-heavy MCP tools so the server's event loop keeps
+    serving other requests while one is being processed.
+    """
+    @wraps(func)
+    async def wrapper(*args, **kwargs):
+        return await asyncio.to_thread(func, *args, **kwargs)
+    return wrapper
+
+
+def compile_keyword_scanner(keywords: Iterable[str]) -> "re.Pattern[str]":
+    """
+    Compile keywords into a single pattern that reports every keyword start in one sweep
+    
+    The alternation is wrapped in a lookahead so matches can overlap, and longer
+    keywords are tried first so each position reports the longest keyword
+    starting there.
+    
+    Args:
+        keywords: Lowercase keywords to match as plain substrings
+        
+    Returns:
+        Compiled pattern whose group(1) is the matched keyword
+    """
+    ordered = sorted(set(keywords), key=len, reverse=True)
+    alternation = '|'.join(re.escape(keyword) for keyword in ordered)
+    return re.compile(f'(?=({alternation}))')
+
+
+def text_lru_cache(maxsize: int = 512, digest_threshold: int = 4096):
+    """
+    LRU-cache a pure function of a single text argument
+    
+    Texts longer than digest_threshold characters are keyed by a 16-byte
+    BLAKE2b digest so the cache does not keep whole transcripts alive.
+    Cached results are shared between callers and must be immutable.
+    
+    Args:
+        maxsize: Maximum number of cached results
+        digest_threshold: Text length above which the key becomes a digest
+    """
+    def decorator(func: Callable[[str], Any]) -> Callable[[str], Any]:
+        cache = OrderedDict()
+        lock = threading.Lock()
+        
+        @wraps(func)
+        def wrapper(text: str) -> Any:
+            if len(text) > digest_threshold:
+                key = hashlib.blake2b(text.encode('utf-8', 'surrogatepass'), digest_size=16).digest()
+            else:
+                key = text
+            
+            with lock:
+                if key in cache:
+                    cache.move_to_end(key)
+                    return cache[key]
+            
+            result = func(text)
+            with lock:
+                cache[key] = result
+                if len(cache) > maxsize:
+                    cache.popitem(last=False)
+            return result
+        
+        wrapper.cache_clear = cache.clear
+        return wrapper
+    return decorator
+
+
+def _json_default(obj: Any) -> Any:
+    """Convert work item models and enums that the JSON encoders don't handle natively"""
+    # Models expose json_fields to skip the defensive copies made by to_dict
+    json_fields = getattr(obj, 'json_fields', None)
+    if json_fields is not None:
+        return json_fields()
+    if hasattr(obj, 'to_dict'):
+        return obj.to_dict()
+    if isinstance(obj, Enum):
+        return obj.value
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def fast_json_dumps(data: Any) -> str:
+    """
+    Serialize data to an indented JSON string
+    
+    Uses orjson when it is installed and the standard library otherwise.
+    Models such as ADOInstructions can be passed directly and are
+    serialized through their to_dict method.
+    
+    Args:
+        data: Data to serialize
+        
+    Returns:
+        JSON string indented by two spaces
+    """
+    if orjson is not None:
+        options = orjson.OPT_INDENT_2 | orjson.OPT_PASSTHROUGH_DATACLASS
+        return orjson.dumps(data, default=_json_default, option=options).decode('utf-8')
+    return json.dumps(data, indent=2, default=_json_default)
+
+
+def fast_json_loads(data: str) -> Any:
+    """
+    Parse a JSON string, using orjson when it is installed
+    
+    Args:
+        data: JSON string to parse
+        
+    Returns:
+        Parsed Python object
+        
+    Raises:
+        json.JSONDecodeError: If the string is not valid JSON (orjson's error subclasses it)
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# orjson options matching json.dumps(indent=2) in safe_json_dumps: dataclasses and
+# datetimes are not serialized natively, so they still fall back to the default
+_SAFE_ORJSON_OPTIONS = (
+    (orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATACLASS | orjson.OPT_PASSTHROUGH_DATETIME)
+    if orjson is not None else 0
+)
+
+
 def safe_json_dumps(data: Any, default: str = "{}") -> str:
     """
     Safely serialize data to JSON string with fallback
@@ -68,6 +211,11 @@ def safe_json_dumps(data: Any, default: str = "{}") -> str:
     Returns:
         JSON string or default value
     """
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, option=_SAFE_ORJSON_OPTIONS).decode('utf-8')
+        except TypeError:
+            pass  # orjson's encode error; let json decide (e.g. integers wider than 64 bits)
     try:
         return json.dumps(data, indent=2, ensure_ascii=False)
     except (TypeError, ValueError) as e:
@@ -6,21 +6,23 @@ and system setup requirements.
 """
 
 import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
 
-def setup_environment():
-    """Setup environment variables and configuration for local and Azure Container Apps"""
-    # Check if running in Azure Container Apps
-    # Azure Container Apps sets CONTAINER_APP_NAME environment variable
-    is_azure_container_app = (
+def _is_azure_container_app() -> bool:
+    """Check if running in Azure Container Apps, which sets CONTAINER_APP_NAME/REVISION"""
+    return (
         os.getenv('CONTAINER_APP_NAME') is not None or 
         os.getenv('CONTAINER_APP_REVISION') is not None or
         os.getenv('AZURE_OPENAI_ENDPOINT') is not None  # If Azure env vars are set, likely in cloud
     )
-    
-    if is_azure_container_app:
+
+
+def setup_environment():
+    """Setup environment variables and configuration for local and Azure Container Apps"""
+    if _is_azure_container_app():
         print("🌐 Running in Azure Container Apps - using Azure environment variables")
         # Validate required environment variables are present
         required_env_vars = ['AZURE_OPENAI_ENDPOINT', 'AZURE_OPENAI_API_KEY']
@@ -48,28 +50,49 @@ def setup_environment():
             print(f"⚠️ Error loading .env file: {e}")
 
 
-def get_azure_openai_config() -> dict:
+@lru_cache(maxsize=1)
+def _azure_openai_config() -> dict:
     """
-    Get Azure OpenAI configuration from environment variables
+    Read the Azure OpenAI settings from the environment once
     
-    Returns:
-        Dictionary containing Azure OpenAI configuration
+    The settings don't change while the server runs. The first call must come
+    after setup_environment() so values from a local .env file are included.
     """
-    config = {
+    return {
         "endpoint": os.getenv("AZURE_OPENAI_ENDPOINT"),
         "api_key": os.getenv("AZURE_OPENAI_API_KEY"),
         "api_version": os.getenv("AZURE_OPENAI_API_VERSION", "2024-12-01-preview"),
         "deployment": os.getenv("AZURE_OPENAI_DEPLOYMENT", "o4-mini-imagebot"),
         "model": os.getenv("AZURE_OPENAI_MODEL", "o4-mini")
     }
+
+
+def get_azure_openai_config() -> dict:
+    """
+    Get Azure OpenAI configuration from environment variables
+    
+    Returns:
+        Dictionary containing Azure OpenAI configuration (a copy, safe to modify)
+    """
+    return dict(_azure_openai_config())
+
+
+def log_azure_config_status() -> bool:
+    """
+    Report whether the Azure OpenAI configuration is complete; call once at startup
+    
+    Returns:
+        True if the endpoint and API key are configured, False otherwise
+    """
+    config = _azure_openai_config()
     
     # Check if required config is present
     if config["endpoint"] and config["api_key"]:
-        print("✅ Azure OpenAI configuration loaded successfully")
-    else:
-        print("⚠️ Azure OpenAI configuration incomplete. Image processing will be unavailable.")
-        
-    return config
+        print("✅ Azure OpenAI configured - Image processing available")
+        return True
+    
+    print("⚠️ Azure OpenAI not configured - Text processing only")
+    return False
 
 
 def validate_azure_openai_config() -> bool:
@@ -79,7 +102,7 @@ def validate_azure_openai_config() -> bool:
     Returns:
         True if configuration is valid, False otherwise
     """
-    config = get_azure_openai_config()
+    config = _azure_openai_config()
     
     required_fields = ["endpoint", "api_key"]
     missing_fields = [field for field in required_fields if not config.get(field)]
@@ -111,16 +134,13 @@ def get_environment_info() -> dict:
     Returns:
         Dictionary containing environment information
     """
-    is_azure_container_app = (
-        os.getenv('CONTAINER_APP_NAME') is not None or 
-        os.getenv('CONTAINER_APP_REVISION') is not None or
-        os.getenv('AZURE_OPENAI_ENDPOINT') is not None
-    )
+    azure_openai = _azure_openai_config()
+    is_azure_container_app = _is_azure_container_app()
     
     return {
         "environment": "azure_container_app" if is_azure_container_app else "local",
         "azure_container_app": is_azure_container_app,
         "container_app_name": os.getenv('CONTAINER_APP_NAME'),
-        "azure_openai_configured": bool(os.getenv('AZURE_OPENAI_ENDPOINT') and os.getenv('AZURE_OPENAI_API_KEY')),
+        "azure_openai_configured": bool(azure_openai["endpoint"] and azure_openai["api_key"]),
         "python_dotenv_available": True
     }
@@ -3,8 +3,8 @@ Utility functions for displaying ADO work item summaries
 """
 
 import json
-from typing import List, Union
-from .models import WorkItem, ADOInstructions
+from typing import Union
+from .models import ADOInstructions, split_epics_and_tasks
 
 
 def display_ado_summary(result: ADOInstructions, title: str = "ADO Work Items Summary") -> str:
@@ -42,53 +42,62 @@ def display_ado_summary(result: ADOInstructions, title: str = "ADO Work Items Su
         return f"❌ No work items found in {title}"
     
     work_items = result.work_items
-    epics = [item for item in work_items if item.work_item_type.value == 'Epic']
-    tasks = [item for item in work_items if item.work_item_type.value == 'Task']
+    epics, tasks = split_epics_and_tasks(work_items)
     
-    # Header
-    summary = f"\n📋 {title} - {result.project_name}\n"
-    summary += "=" * 80 + "\n"
+    # Header (lines are collected and joined once; the leading "" gives the opening blank line)
+    lines = ["", f"📋 {title} - {result.project_name}", "=" * 80]
+    append = lines.append
     
     # Quick stats
     structure_status = "✅ Proper dependency chain detected!" if len(epics) == 1 and len(tasks) > 0 else "⚠️ Non-standard structure"
-    summary += f"📊 Structure: {len(epics)} Epic → {len(tasks)} Tasks ({structure_status})\n\n"
+    append(f"📊 Structure: {len(epics)} Epic → {len(tasks)} Tasks ({structure_status})")
+    append("")
+    
+    # Group tasks under their parent epic once, rather than rescanning all tasks per epic
+    tasks_by_parent = {}
+    for task in tasks:
+        tasks_by_parent.setdefault(task.parent_id, []).append(task)
     
     # Epic details
     for i, epic in enumerate(epics, 1):
-        summary += f"🎯 Epic {i}: \"{epic.title}\"\n"
-        summary += f"   Priority: {epic.priority.value} | Tags: {', '.join(epic.tags)}\n"
+        append(f"🎯 Epic {i}: \"{epic.title}\"")
+        append(f"   Priority: {epic.priority.value} | Tags: {', '.join(epic.tags)}")
         
         # Truncate description for readability
         desc = epic.description[:100] + "..." if len(epic.description) > 100 else epic.description
-        summary += f"   Description: {desc}\n\n"
+        append(f"   Description: {desc}")
+        append("")
         
         # Tasks under this epic
-        epic_tasks = [t for t in tasks if hasattr(t, 'parent_id') and t.parent_id == epic.id]
+        epic_tasks = tasks_by_parent.get(epic.id, ())
         
         if epic_tasks:
-            summary += f"   📋 Tasks ({len(epic_tasks)}):\n"
+            append(f"   📋 Tasks ({len(epic_tasks)}):")
             
             for j, task in enumerate(epic_tasks, 1):
                 is_last = j == len(epic_tasks)
                 connector = "└──" if is_last else "├──"
                 
-                summary += f"   {connector} {j}. {task.title} [{task.priority.value} Priority]\n"
+                append(f"   {connector} {j}. {task.title} [{task.priority.value} Priority]")
                 if task.tags:
                     indent = "       " if is_last else "   │   "
-                    summary += f"{indent}└── Tags: {', '.join(task.tags)}\n"
+                    append(f"{indent}└── Tags: {', '.join(task.tags)}")
     
     # Workflow sequence
     if tasks:
-        summary += f"\n🔗 Workflow Sequence: {' → '.join([task.title for task in tasks])}\n"
+        append("")
+        append(f"🔗 Workflow Sequence: {' → '.join([task.title for task in tasks])}")
         
         if len(epics) == 1 and len(tasks) > 1:
-            summary += "✅ SUCCESS: Proper dependency structure (1 Epic with dependent tasks)\n"
+            append("✅ SUCCESS: Proper dependency structure (1 Epic with dependent tasks)")
         elif len(epics) > 1:
-            summary += f"⚠️ WARNING: Multiple Epics ({len(epics)}) - should be 1 Epic for workflow diagrams\n"
+            append(f"⚠️ WARNING: Multiple Epics ({len(epics)}) - should be 1 Epic for workflow diagrams")
         else:
-            summary += "📋 INFO: Standard structure\n"
+            append("📋 INFO: Standard structure")
     
-    return summary
+    # Every line ends with a newline, including the last
+    append("")
+    return "\n".join(lines)
 
 
 def print_ado_summary(result: Union[ADOInstructions, str, dict], title: str = "ADO Work Items Summary"):
@@ -105,14 +114,14 @@ def print_ado_summary(result: Union[ADOInstructions, str, dict], title: str = "A
         try:
             data = json.loads(result)
             result = ADOInstructions.from_dict(data)
-        except (json.JSONDecodeError, KeyError) as e:
+        except (json.JSONDecodeError, KeyError, TypeError, AttributeError) as e:
             print(f"❌ Error parsing JSON for summary: {e}")
             return
     elif isinstance(result, dict):
         # Dictionary
         try:
             result = ADOInstructions.from_dict(result)
-        except KeyError as e:
+        except (KeyError, TypeError, AttributeError) as e:
             print(f"❌ Error creating ADOInstructions from dict: {e}")
             return
     elif not isinstance(result, ADOInstructions):
@@ -136,8 +145,7 @@ def get_quick_stats(result: ADOInstructions) -> dict:
         return {"epics": 0, "tasks": 0, "is_proper_structure": False, "status": "No work items"}
     
     work_items = result.work_items
-    epics = [item for item in work_items if item.work_item_type.value == 'Epic']
-    tasks = [item for item in work_items if item.work_item_type.value == 'Task']
+    epics, tasks = split_epics_and_tasks(work_items)
     
     is_proper_structure = len(epics) == 1 and len(tasks) > 0
     
@@ -5,49 +5,84 @@ This module provides standardized error handling patterns to reduce
 code duplication across the application.
 """
 
+import inspect
 import json
+import time
+from dataclasses import dataclass
 from functools import wraps
-from typing import Any, Callable, Dict, Optional, Union
+from typing import Any, Callable, Dict, Iterable, Optional, Union
 import logging
 
+from .common_utils import fast_json_dumps
+
 # Configure logging for error tracking
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+# Layout of safe_json_response's error payload, matching the indent=2 output
+# of fast_json_dumps; only the JSON-encoded message is filled in per error
+_ERROR_JSON_TEMPLATE = '{{\n  "error": {}\n}}'
+
+
 def safe_json_response(func: Callable) -> Callable:
     """
     Decorator to safely handle JSON responses for MCP tools
     
-    Automatically handles exceptions and returns properly formatted JSON responses
+    Automatically handles exceptions and returns properly formatted JSON responses.
+    The wrapped function may return a dict or a model with to_dict (e.g. ADOInstructions).
     """
+    # Bound once per decorated function instead of looked up on every call
+    func_name = func.__name__
+    dumps = fast_json_dumps
+    error_json = _ERROR_JSON_TEMPLATE.format
+    encode_message = json.JSONEncoder(ensure_ascii=False).encode
+    log_error = logger.error
+    
     @wraps(func)
     def wrapper(*args, **kwargs) -> str:
         try:
             result = func(*args, **kwargs)
             if isinstance(result, str):
                 return result
-            return json.dumps(result, indent=2)
+            return dumps(result)
         except Exception as e:
-            error_msg = f"Error in {func.__name__}: {str(e)}"
-            logger.error(error_msg)
-            return json.dumps({"error": error_msg}, indent=2)
+            error_msg = f"Error in {func_name}: {e}"
+            log_error(error_msg)
+            return error_json(encode_message(error_msg))
+    
+    # The wrapper always returns a JSON string; advertise that instead of the wrapped return type
+    wrapper.__signature__ = inspect.signature(func).replace(return_annotation=str)
     return wrapper
 
 
+class OperationError(Exception):
+    """Raised by @safe_operation when the wrapped operation fails; the original error is the __cause__"""
+    
+    def __init__(self, operation: str, cause: Exception):
+        self.operation = operation
+        self.cause = cause
+        super().__init__(f"Error during {operation}: {cause}")
+
+
 def safe_operation(operation_name: str = "operation"):
     """
     Decorator for safe operation handling with custom operation names
+    
+    Failures are logged and re-raised as OperationError, so callers can catch
+    that type and read the operation name and original exception.
     """
+    log_error = logger.error
+    
     def decorator(func: Callable) -> Callable:
         @wraps(func)
         def wrapper(*args, **kwargs) -> Any:
             try:
                 return func(*args, **kwargs)
             except Exception as e:
-                error_msg = f"Error during {operation_name}: {str(e)}"
-                logger.error(error_msg)
-                raise Exception(error_msg) from e
+                error = OperationError(operation_name, e)
+                log_error("%s", error)
+                raise error from e
         return wrapper
     return decorator
 
@@ -66,7 +101,7 @@ def handle_import_error(module_name: str, fallback_value: Any = None):
             try:
                 return func(*args, **kwargs)
             except ImportError as e:
-                logger.warning(f"⚠️ {module_name} not available: {e}")
+                logger.warning("⚠️ %s not available: %s", module_name, e)
                 if fallback_value is not None:
                     return fallback_value
                 raise
@@ -74,34 +109,38 @@ def handle_import_error(module_name: str, fallback_value: Any = None):
     return decorator
 
 
+# Marks a field absent from the data being validated
+_MISSING = object()
+
+
 class ValidationError(Exception):
     """Custom exception for validation errors"""
     pass
 
 
-def validate_json_structure(data: Dict[str, Any], required_fields: list) -> list:
+def validate_json_structure(data: Dict[str, Any], required_fields: Iterable[str]) -> list:
     """
     Validate JSON structure and return list of issues
     
     Args:
         data: Dictionary to validate
-        required_fields: List of required field names
+        required_fields: Required field names; a tuple is cheapest to iterate
         
     Returns:
         List of validation issues (empty if valid)
     """
     issues = []
     
+    # One dict probe per field; the sentinel tells a missing field from a None value
     for field in required_fields:
-        if field not in data:
+        value = data.get(field, _MISSING)
+        if value is _MISSING:
             issues.append(f"Missing required field: {field}")
-        elif data[field] is None:
+        elif value is None:
             issues.append(f"Null value for required field: {field}")
-        elif isinstance(data[field], str) and not data[field].strip():
+        elif type(value) is str and not value.strip():
             issues.append(f"Empty string for required field: {field}")
-        elif isinstance(data[field], list) and len(data[field]) == 0:
-            # Allow empty lists for some fields like work_items
-            continue
+        # Empty lists are allowed for some fields like work_items
     
     return issues
 
@@ -110,28 +149,54 @@ def safe_file_operation(operation: str):
     """
     Decorator for safe file operations
     """
+    log_error = logger.error
+    
     def decorator(func: Callable) -> Callable:
         @wraps(func)
         def wrapper(*args, **kwargs):
             try:
                 return func(*args, **kwargs)
             except FileNotFoundError as e:
-                error_msg = f"File not found during {operation}: {str(e)}"
-                logger.error(error_msg)
+                error_msg = f"File not found during {operation}: {e}"
+                log_error(error_msg)
                 return {"error": error_msg}
             except PermissionError as e:
-                error_msg = f"Permission denied during {operation}: {str(e)}"
-                logger.error(error_msg)
+                error_msg = f"Permission denied during {operation}: {e}"
+                log_error(error_msg)
                 return {"error": error_msg}
             except Exception as e:
-                error_msg = f"Unexpected error during {operation}: {str(e)}"
-                logger.error(error_msg)
+                error_msg = f"Unexpected error during {operation}: {e}"
+                log_error(error_msg)
                 return {"error": error_msg}
         return wrapper
     return decorator
 
 
-def standardize_error_response(error: Exception, context: str = "") -> Dict[str, str]:
+@dataclass(slots=True)
+class ErrorResponse:
+    """Standardized error details; slotted so bulk error paths stay light"""
+    error_type: str
+    message: str
+    context: str = ""
+    
+    @classmethod
+    def from_exception(cls, error: Exception, context: str = "") -> 'ErrorResponse':
+        """Build an error response from an exception"""
+        return cls(type(error).__name__, str(error), context)
+    
+    def as_dict(self) -> Dict[str, Any]:
+        """Convert to the dictionary form used in JSON responses"""
+        response = {
+            "error": True,
+            "error_type": self.error_type,
+            "message": self.message
+        }
+        if self.context:
+            response["context"] = self.context
+        return response
+
+
+def standardize_error_response(error: Exception, context: str = "") -> Dict[str, Any]:
     """
     Create standardized error response dictionary
     
@@ -142,27 +207,17 @@ def standardize_error_response(error: Exception, context: str = "") -> Dict[str,
     Returns:
         Standardized error response dictionary
     """
-    error_type = type(error).__name__
-    error_msg = str(error)
-    
-    response = {
-        "error": True,
-        "error_type": error_type,
-        "message": error_msg
-    }
-    
-    if context:
-        response["context"] = context
-        
-    logger.error(f"{context}: {error_type} - {error_msg}")
-    return response
+    response = ErrorResponse.from_exception(error, context)
+    logger.error("%s: %s - %s", context, response.error_type, response.message)
+    return response.as_dict()
 
 
 def retry_operation(max_retries: int = 3, delay: float = 1.0):
     """
     Decorator to retry operations with exponential backoff
     """
-    import time
+    # Backoff waits are fixed per decoration: delay, 2*delay, 4*delay, ...
+    waits = tuple(delay * (1 << attempt) for attempt in range(max_retries))
     
     def decorator(func: Callable) -> Callable:
         @wraps(func)
@@ -175,11 +230,11 @@ def retry_operation(max_retries: int = 3, delay: float = 1.0):
                 except Exception as e:
                     last_exception = e
                     if attempt < max_retries - 1:
-                        wait_time = delay * (2 ** attempt)
-                        logger.warning(f"Attempt {attempt + 1} failed, retrying in {wait_time}s: {e}")
+                        wait_time = waits[attempt]
+                        logger.warning("Attempt %d failed, retrying in %ss: %s", attempt + 1, wait_time, e)
                         time.sleep(wait_time)
                     else:
-                        logger.error(f"All {max_retries} attempts failed")
+                        logger.error("All %d attempts failed", max_retries)
             
             raise last_exception
         return wrapper
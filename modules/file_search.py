@@ -6,10 +6,280 @@ without requiring users to know exact file paths.
 """
 
 import os
-import glob
+import re
 import json
+import time
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from fnmatch import translate
 from pathlib import Path
-from typing import Dict, List, Any
+from copy import deepcopy
+from typing import Dict, FrozenSet, Iterator, List, Any, Optional, Tuple
+
+
+# Supported file extensions by category
+IMAGE_EXTENSIONS = frozenset({'.jpg', '.jpeg', '.png', '.gif', '.bmp', '.webp', '.tiff', '.svg'})
+TEXT_EXTENSIONS = frozenset({'.txt', '.md', '.doc', '.docx', '.pdf', '.rtf', '.csv'})
+
+# Result list each supported extension is reported under
+_EXTENSION_CATEGORY = {
+    **{ext: 'images' for ext in IMAGE_EXTENSIONS},
+    **{ext: 'text_files' for ext in TEXT_EXTENSIONS},
+}
+
+# Fixed search locations under the user's home folder, resolved once at import
+# ("current" is added per search because the working directory can change)
+_USER_HOME = Path.home()
+_HOME_LOCATIONS = {
+    'desktop': _USER_HOME / 'Desktop',
+    'documents': _USER_HOME / 'Documents',
+    'downloads': _USER_HOME / 'Downloads',
+    'pictures': _USER_HOME / 'Pictures',
+}
+
+# Folders never worth descending into: tool/cache trees and Windows system
+# folders that hold thousands of irrelevant files (hidden ".name" folders are
+# skipped as well)
+_SKIP_DIRS = frozenset({
+    'node_modules', '__pycache__', '.git', '.venv', 'venv',
+    'AppData', '$Recycle.Bin', 'System Volume Information',
+})
+
+# Shared by all searches so worker threads are reused across calls; locations
+# are walked in parallel because directory listing and stat calls release the GIL
+_SEARCH_EXECUTOR = ThreadPoolExecutor(max_workers=8, thread_name_prefix="file-search")
+
+# Recent search results, so a client repeating the same query doesn't walk the
+# tree again; entries expire after a short TTL so new files still show up
+SEARCH_CACHE_TTL_SECONDS = 30.0
+SEARCH_CACHE_MAX_ENTRIES = 64
+_search_cache: "OrderedDict[Tuple[str, ...], Tuple[float, Dict[str, Any]]]" = OrderedDict()
+_search_cache_lock = threading.Lock()
+
+
+# Number of files per category listed by format_search_results_for_display
+DISPLAY_PREVIEW_LIMIT = 10
+
+
+def _name_sort_key(file_info: Dict[str, Any]) -> str:
+    """Sort key ordering file info dicts by case-insensitive name"""
+    return file_info['name'].lower()
+
+
+def invalidate_search_cache() -> None:
+    """Discard all cached search results (e.g. after files were added or removed)"""
+    with _search_cache_lock:
+        _search_cache.clear()
+
+
+def _compile_search_pattern(search_pattern: str) -> Optional[re.Pattern]:
+    """
+    Compile a user search pattern once for matching file names
+    
+    Wildcard patterns ("*.png", "meeting?") must match the whole file name;
+    plain text matches anywhere in the name (before the extension). Patterns
+    with folder parts ("TestImages/*.jpg") match the path below the search
+    location instead (see _translate_path_pattern). Matching ignores case.
+    
+    Returns:
+        Compiled pattern, or None when there is nothing to filter on
+    """
+    if not search_pattern:
+        return None
+    if _has_path_separator(search_pattern):
+        return re.compile(_translate_path_pattern(search_pattern), re.IGNORECASE)
+    if '*' in search_pattern or '?' in search_pattern:
+        return re.compile(translate(search_pattern), re.IGNORECASE)
+    return re.compile(re.escape(search_pattern), re.IGNORECASE)
+
+
+def _has_path_separator(search_pattern: str) -> bool:
+    """Whether a search pattern names folders as well as a file (e.g. "TestImages/*.jpg")"""
+    return '/' in search_pattern or '\\' in search_pattern
+
+
+def _translate_path_pattern(search_pattern: str) -> str:
+    """
+    Translate a pattern with folder parts into a regex for '/'-separated relative paths
+    
+    Like a recursive glob, the pattern may match the end of the path below any
+    folder. Wildcards stay within one path segment, except "**/", which spans
+    any number of folders. A plain-text pattern matches anywhere in the last
+    segment, which is then the path without its extension.
+    """
+    pattern = search_pattern.replace('\\', '/')
+    if '*' not in pattern and '?' not in pattern:
+        return r'(?:.*/)?[^/]*' + re.escape(pattern) + r'[^/]*\Z'
+    
+    parts = []
+    index = 0
+    while index < len(pattern):
+        if pattern.startswith('**/', index):
+            parts.append('(?:.*/)?')
+            index += 3
+            continue
+        char = pattern[index]
+        if char == '*':
+            parts.append('[^/]*')
+        elif char == '?':
+            parts.append('[^/]')
+        else:
+            parts.append(re.escape(char))
+        index += 1
+    return '(?:.*/)?' + ''.join(parts) + r'\Z'
+
+
+def _pattern_extension(search_pattern: str) -> Optional[str]:
+    """
+    Return the literal extension a wildcard pattern ends with (e.g. ".png" for "*.png")
+    
+    Returns:
+        Lowercased extension, or None when the pattern doesn't pin one down
+    """
+    _, dot, ext = search_pattern.rpartition('.')
+    if not dot or not ext or any(char in ext for char in '*?[]/\\'):
+        return None
+    return '.' + ext.lower()
+
+
+def _is_pruned(relative: Path) -> bool:
+    """Whether _iter_files skips one of the folders on this relative path"""
+    return any(part[0] == '.' or part in _SKIP_DIRS for part in relative.parts)
+
+
+def _plan_location_walks(locations: Dict[str, Path]) -> List[Tuple[str, Path, Dict[str, str]]]:
+    """
+    Decide which search locations to walk so no folder is walked twice
+    
+    A location inside another one (e.g. "desktop" under "current" when the
+    working directory is the home folder) is not walked separately; the
+    enclosing walk relabels its files instead, so every file is reported under
+    the most specific location that contains it. A location that is the same
+    folder as an earlier one is dropped. Nested locations the enclosing walk
+    would prune (hidden or _SKIP_DIRS folders) are walked on their own.
+    
+    Returns:
+        (name, path, nested) per walk in the original order, where nested maps
+        folder paths below path to the location name their files get
+    """
+    resolved = []
+    seen = set()
+    for name, path in locations.items():
+        try:
+            if not path.is_dir():
+                continue
+            real_path = path.resolve()
+        except OSError:
+            continue
+        if real_path not in seen:
+            seen.add(real_path)
+            resolved.append((name, path, real_path))
+    
+    def reaches(outer: Path, inner: Path) -> bool:
+        """Whether a walk of outer visits the strictly nested folder inner"""
+        return inner != outer and inner.is_relative_to(outer) and not _is_pruned(inner.relative_to(outer))
+    
+    walks = []
+    for name, path, real_path in resolved:
+        if any(reaches(other, real_path) for _, _, other in resolved):
+            continue
+        nested = {
+            os.path.join(str(path), *other_real.relative_to(real_path).parts): other_name
+            for other_name, _, other_real in resolved
+            if reaches(real_path, other_real)
+        }
+        walks.append((name, path, nested))
+    return walks
+
+
+def _iter_files(root: str, root_label: str, nested: Dict[str, str]) -> Iterator[Tuple[os.DirEntry, str]]:
+    """
+    Yield every file below root with the location label it belongs to
+    
+    The tree is walked once with os.scandir. Files get root_label unless they
+    sit below a folder listed in nested, which switches the label for that
+    subtree. Directories that can't be read are skipped, symlinked directories
+    are not followed so links can't cause loops, and hidden or tool/system
+    folders (_SKIP_DIRS) are pruned without being listed.
+    """
+    stack = [(root, root_label)]
+    while stack:
+        directory, label = stack.pop()
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            name = entry.name
+                            if name[0] != '.' and name not in _SKIP_DIRS:
+                                stack.append((entry.path, nested.get(entry.path, label)))
+                        elif entry.is_file():
+                            yield entry, label
+                    except OSError:
+                        # Skip entries that can't be inspected (e.g. broken links, permission issues)
+                        continue
+        except OSError:
+            # Skip directories we can't access (e.g. permission issues, path too long)
+            continue
+
+
+def _scan_location(
+    location_name: str,
+    location_path: Path,
+    nested: Dict[str, str],
+    search_ext_set: FrozenSet[str],
+    pattern_re: Optional[re.Pattern],
+    is_wildcard: bool,
+    match_path: bool
+) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """
+    Find the matching images and text files in one search location
+    
+    Returns:
+        Tuple of (images, text_files) file info lists
+    """
+    found = {'images': [], 'text_files': []}
+    if not location_path.is_dir():
+        return found['images'], found['text_files']
+    
+    root = str(location_path)
+    for entry, label in _iter_files(root, location_name, nested):
+        name = entry.name
+        stem, ext = os.path.splitext(name)
+        ext = ext.lower()
+        if ext not in search_ext_set:
+            continue
+        
+        if pattern_re is not None:
+            # Wildcard patterns match the whole file name, plain text the name before the extension;
+            # patterns with folder parts match the same way against the path below the location
+            if match_path:
+                relative = os.path.relpath(entry.path, root).replace(os.sep, '/')
+                if not pattern_re.match(relative if is_wildcard else os.path.splitext(relative)[0]):
+                    continue
+            elif is_wildcard:
+                if not pattern_re.match(name):
+                    continue
+            elif not pattern_re.search(stem):
+                continue
+        
+        try:
+            file_info = {
+                'name': name,
+                'path': entry.path,
+                'location': label,
+                'size_mb': round(entry.stat().st_size / (1024 * 1024), 2),
+                'extension': ext
+            }
+        except OSError:
+            # Skip files that can't be accessed (e.g., long paths, permission issues)
+            continue
+        
+        # Categorize file
+        found[_EXTENSION_CATEGORY[ext]].append(file_info)
+    
+    return found['images'], found['text_files']
 
 
 def search_files_for_processing(
@@ -31,34 +301,47 @@ def search_files_for_processing(
     Returns:
         Dictionary with found files categorized by type and location
     """
+    # "current" depends on the working directory, so it's part of the key
+    cache_key = (search_pattern, file_types, search_locations, os.getcwd())
+    now = time.monotonic()
+    
+    with _search_cache_lock:
+        cached = _search_cache.get(cache_key)
+        if cached is not None:
+            if now - cached[0] < SEARCH_CACHE_TTL_SECONDS:
+                _search_cache.move_to_end(cache_key)
+                return deepcopy(cached[1])
+            del _search_cache[cache_key]
+    
+    found_files = _search_files(search_pattern, file_types, search_locations)
     
-    # Define file extensions
-    image_extensions = ['.jpg', '.jpeg', '.png', '.gif', '.bmp', '.webp', '.tiff', '.svg']
-    text_extensions = ['.txt', '.md', '.doc', '.docx', '.pdf', '.rtf', '.csv']
+    with _search_cache_lock:
+        _search_cache[cache_key] = (now, found_files)
+        if len(_search_cache) > SEARCH_CACHE_MAX_ENTRIES:
+            _search_cache.popitem(last=False)
+    
+    # Callers get their own copy so they can't alter the cached result
+    return deepcopy(found_files)
+
+
+def _search_files(search_pattern: str, file_types: str, search_locations: str) -> Dict[str, Any]:
+    """Uncached implementation of search_files_for_processing"""
     
     # Parse file types to search for
     search_file_types = [ft.strip().lower() for ft in file_types.split(',')]
-    extensions_to_search = []
     
     if 'all' in search_file_types:
-        extensions_to_search = image_extensions + text_extensions
+        search_ext_set = IMAGE_EXTENSIONS | TEXT_EXTENSIONS
     else:
+        search_ext_set = frozenset()
         if 'images' in search_file_types:
-            extensions_to_search.extend(image_extensions)
+            search_ext_set |= IMAGE_EXTENSIONS
         if 'text' in search_file_types:
-            extensions_to_search.extend(text_extensions)
+            search_ext_set |= TEXT_EXTENSIONS
     
     # Define search locations
     locations = {}
-    user_home = Path.home()
-    
-    possible_locations = {
-        'desktop': user_home / 'Desktop',
-        'documents': user_home / 'Documents', 
-        'downloads': user_home / 'Downloads',
-        'pictures': user_home / 'Pictures',
-        'current': Path.cwd()
-    }
+    possible_locations = {**_HOME_LOCATIONS, 'current': Path.cwd()}
     
     # Parse search locations
     search_locs = [loc.strip().lower() for loc in search_locations.split(',')]
@@ -76,67 +359,48 @@ def search_files_for_processing(
         'text_files': [],
         'search_summary': {
             'pattern': search_pattern,
-            'locations_searched': list(locations.keys()),
+            'locations_searched': [],
             'file_types': search_file_types,
             'total_found': 0
         }
     }
     
-    for location_name, location_path in locations.items():
-        if not location_path.exists():
-            continue
-            
-        try:
-            # Search recursively in the location
-            for ext in extensions_to_search:
-                if search_pattern:
-                    # If pattern specified, use it
-                    if '*' in search_pattern or '?' in search_pattern:
-                        pattern = f"**/{search_pattern}"
-                    else:
-                        pattern = f"**/*{search_pattern}*{ext}"
-                else:
-                    # Search for all files with the extension
-                    pattern = f"**/*{ext}"
-                
-                try:
-                    matches = list(location_path.glob(pattern))
-                    
-                    for match in matches:
-                        if match.is_file():
-                            try:
-                                file_info = {
-                                    'name': match.name,
-                                    'path': str(match),
-                                    'location': location_name,
-                                    'size_mb': round(match.stat().st_size / (1024 * 1024), 2),
-                                    'extension': match.suffix.lower()
-                                }
-                                
-                                # Categorize file
-                                if match.suffix.lower() in image_extensions:
-                                    found_files['images'].append(file_info)
-                                elif match.suffix.lower() in text_extensions:
-                                    found_files['text_files'].append(file_info)
-                                    
-                            except (OSError, PermissionError):
-                                # Skip files that can't be accessed (e.g., long paths, permission issues)
-                                continue
-                                
-                except (OSError, PermissionError):
-                    # Skip patterns that cause issues (e.g., path too long)
-                    continue
-        
-        except (PermissionError, OSError):
-            # Skip locations we can't access
-            continue
+    # Walk each location once and classify files by extension, rather than
+    # running a separate recursive glob for every extension
+    is_wildcard = '*' in search_pattern or '?' in search_pattern
+    match_path = _has_path_separator(search_pattern)
+    pattern_re = _compile_search_pattern(search_pattern)
+    
+    # A wildcard pattern matches whole names, so one like "*.png" can only
+    # ever match its own extension; skip the walk if that type wasn't requested
+    if is_wildcard:
+        pattern_ext = _pattern_extension(search_pattern)
+        if pattern_ext is not None:
+            search_ext_set = search_ext_set & {pattern_ext}
+    walks = _plan_location_walks(locations) if search_ext_set else []
+    
+    # Report the locations actually scanned, in the order they were requested
+    scanned = {name for name, _, _ in walks}
+    scanned.update(label for _, _, nested in walks for label in nested.values())
+    found_files['search_summary']['locations_searched'] = [name for name in locations if name in scanned]
+    
+    def scan(walk: Tuple[str, Path, Dict[str, str]]) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        location_name, location_path, nested = walk
+        return _scan_location(
+            location_name, location_path, nested, search_ext_set, pattern_re, is_wildcard, match_path
+        )
+    
+    # Results come back in location order, so the output doesn't depend on thread timing
+    for images, text_files in _SEARCH_EXECUTOR.map(scan, walks):
+        found_files['images'].extend(images)
+        found_files['text_files'].extend(text_files)
     
     # Update summary
     found_files['search_summary']['total_found'] = len(found_files['images']) + len(found_files['text_files'])
     
     # Sort files by name for better presentation
-    found_files['images'].sort(key=lambda x: x['name'].lower())
-    found_files['text_files'].sort(key=lambda x: x['name'].lower())
+    found_files['images'].sort(key=_name_sort_key)
+    found_files['text_files'].sort(key=_name_sort_key)
     
     return found_files
 
@@ -172,24 +436,26 @@ def format_search_results_for_display(search_results: Dict[str, Any]) -> str:
     lines.append(f"📊 Total found: {summary['total_found']} files")
     lines.append("")
     
-    # Show images
-    if search_results.get('images'):
-        lines.append(f"🖼️  IMAGES ({len(search_results['images'])}):")
-        for img in search_results['images'][:10]:  # Show first 10
+    # Show images (search results are already sorted by name, so the first few are a slice)
+    images = search_results.get('images')
+    if images:
+        lines.append(f"🖼️  IMAGES ({len(images)}):")
+        for img in images[:DISPLAY_PREVIEW_LIMIT]:
             lines.append(f"   • {img['name']} ({img['size_mb']} MB) - {img['location']}")
             lines.append(f"     📂 {img['path']}")
-        if len(search_results['images']) > 10:
-            lines.append(f"   ... and {len(search_results['images']) - 10} more images")
+        if len(images) > DISPLAY_PREVIEW_LIMIT:
+            lines.append(f"   ... and {len(images) - DISPLAY_PREVIEW_LIMIT} more images")
         lines.append("")
     
     # Show text files
-    if search_results.get('text_files'):
-        lines.append(f"📝 TEXT FILES ({len(search_results['text_files'])}):")
-        for txt in search_results['text_files'][:10]:  # Show first 10
+    text_files = search_results.get('text_files')
+    if text_files:
+        lines.append(f"📝 TEXT FILES ({len(text_files)}):")
+        for txt in text_files[:DISPLAY_PREVIEW_LIMIT]:
             lines.append(f"   • {txt['name']} ({txt['size_mb']} MB) - {txt['location']}")
             lines.append(f"     📂 {txt['path']}")
-        if len(search_results['text_files']) > 10:
-            lines.append(f"   ... and {len(search_results['text_files']) - 10} more text files")
+        if len(text_files) > DISPLAY_PREVIEW_LIMIT:
+            lines.append(f"   ... and {len(text_files) - DISPLAY_PREVIEW_LIMIT} more text files")
         lines.append("")
     
     lines.append("💡 Next steps:")
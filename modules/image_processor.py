@@ -5,113 +5,70 @@ This module provides image analysis capabilities using Azure OpenAI's vision mod
 to extract project requirements and generate ADO work items from visual content.
 """
 
-import base64
+import asyncio
+import io
+import logging
+import mmap
 import os
+import re
 import json
-from typing import Dict, List, Optional, Tuple
-from openai import AzureOpenAI
-from pathlib import Path
-
-from .models import WorkItem, WorkItemType, Priority, ADOInstructions, ORGANIZATION_CONTEXT
+from functools import lru_cache
+from stat import S_ISREG
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Tuple
+
+try:
+    # SIMD-accelerated encoder with the same API and output as the standard library's
+    from pybase64 import b64encode
+except ImportError:
+    from base64 import b64encode  # Optional speed-up; the standard library encoder is used instead
+
+from .config import _azure_openai_config
+from .models import WorkItem, WorkItemType, Priority, PRIORITY_BY_VALUE, ADOInstructions, ORGANIZATION_CONTEXT
 from .error_handling import safe_operation, ValidationError, standardize_error_response
-from .common_utils import clean_text, safe_json_dumps
+from .common_utils import clean_text, fast_json_loads
 from .text_processor import determine_priority_from_text
-from .display_utils import print_ado_summary, get_quick_stats
+from .display_utils import print_ado_summary
 
+if TYPE_CHECKING:
+    from openai import AsyncAzureOpenAI, AzureOpenAI
 
-def get_azure_openai_client() -> Optional[AzureOpenAI]:
-    """
-    Initialize Azure OpenAI client with environment configuration
-    
-    Returns:
-        AzureOpenAI client instance or None if configuration is missing
-    """
-    try:
-        endpoint = os.getenv("AZURE_OPENAI_ENDPOINT")
-        api_key = os.getenv("AZURE_OPENAI_API_KEY")
-        api_version = os.getenv("AZURE_OPENAI_API_VERSION", "2024-12-01-preview")
-        
-        if not endpoint or not api_key:
-            print("⚠️ Azure OpenAI configuration missing. Image processing will be unavailable.")
-            return None
-            
-        client = AzureOpenAI(
-            api_version=api_version,
-            azure_endpoint=endpoint,
-            api_key=api_key,
-        )
-        
-        print("✅ Azure OpenAI client initialized successfully")
-        return client
-        
-    except Exception as e:
-        print(f"❌ Failed to initialize Azure OpenAI client: {e}")
-        return None
+logger = logging.getLogger(__name__)
 
+# Largest image accepted for analysis, whether loaded from disk or passed as base64
+MAX_IMAGE_SIZE_BYTES = 10 * 1024 * 1024
 
-def load_image_as_base64(image_path: str) -> str:
-    """
-    Load an image file and convert it to base64 format
-    
-    Args:
-        image_path: Path to the image file
-        
-    Returns:
-        Base64 encoded image data
-        
-    Raises:
-        ValidationError: If image file cannot be loaded
-    """
-    try:
-        if not os.path.exists(image_path):
-            raise ValidationError(f"Image file not found: {image_path}")
-            
-        # Check file extension
-        supported_extensions = {'.png', '.jpg', '.jpeg', '.gif', '.bmp', '.webp'}
-        file_ext = Path(image_path).suffix.lower()
-        
-        if file_ext not in supported_extensions:
-            raise ValidationError(f"Unsupported image format: {file_ext}. Supported: {supported_extensions}")
-            
-        # Check file size (limit to 10MB)
-        file_size = os.path.getsize(image_path)
-        if file_size > 10 * 1024 * 1024:  # 10MB
-            raise ValidationError(f"Image file too large: {file_size / (1024*1024):.1f}MB. Maximum: 10MB")
-            
-        with open(image_path, 'rb') as image_file:
-            image_data = image_file.read()
-            base64_image = base64.b64encode(image_data).decode('utf-8')
-            
-        print(f"✅ Image loaded successfully: {Path(image_path).name} ({file_size / 1024:.1f}KB)")
-        return base64_image
-        
-    except Exception as e:
-        raise ValidationError(f"Failed to load image: {str(e)}")
+# Image file extensions accepted for analysis
+SUPPORTED_IMAGE_EXTENSIONS = frozenset({'.png', '.jpg', '.jpeg', '.gif', '.bmp', '.webp'})
 
+# Images re-encoded as JPEG before upload when Pillow is installed: lossless or
+# uncompressed formats, and any image larger than the size threshold
+JPEG_RECOMPRESS_EXTENSIONS = frozenset({'.png', '.bmp', '.gif', '.webp'})
+JPEG_RECOMPRESS_MIN_BYTES = 512 * 1024
+JPEG_QUALITY = 85
 
-def analyze_image_with_azure_openai(image_base64: str, description: str = "") -> Dict:
-    """
-    Analyze an image using Azure OpenAI vision capabilities
-    
-    Args:
-        image_base64: Base64 encoded image data
-        description: Optional description or context about the image
-        
-    Returns:
-        Dictionary containing analysis results and extracted features
-        
-    Raises:
-        ValidationError: If analysis fails or Azure OpenAI is unavailable
-    """
-    client = get_azure_openai_client()
-    if not client:
-        raise ValidationError("Azure OpenAI client not available. Check configuration.")
-        
-    try:
-        deployment = os.getenv("AZURE_OPENAI_DEPLOYMENT", "o4-mini-imagebot")
-        
-        # Create system prompt for ADO work item extraction with dependency analysis
-        system_prompt = """You are an expert at analyzing workflow diagrams and visual project documentation to extract software requirements and generate Azure DevOps work items with proper dependency relationships.
+# Responses longer than this are parsed in a worker thread by the async analysis,
+# so a large payload doesn't block the event loop
+ASYNC_PARSE_THRESHOLD_CHARS = 100_000
+
+# Epic description used when the model's analysis doesn't provide one
+EPIC_DEFAULT_DESCRIPTION_TEMPLATE = (
+    "Main workflow implementation based on dependency analysis. "
+    "Flow detected: {flow_direction}. "
+    "Acceptance Criteria: Complete workflow implementation following visual dependency chain, "
+    "all workflow steps properly integrated, dependencies correctly implemented in sequence."
+)
+
+# Acceptance criteria closing every workflow task's description
+TASK_ACCEPTANCE_CRITERIA = (
+    "Acceptance Criteria: Implementation follows workflow dependencies, "
+    "integration with previous workflow steps is verified, "
+    "code is properly tested, documentation includes dependency information."
+)
+
+# Static prompts for image analysis. They contain no per-call data and come
+# first in every request, so Azure OpenAI prompt caching can reuse the shared
+# prefix; the per-call context and the image are appended after them.
+ANALYSIS_SYSTEM_PROMPT = """You are an expert at analyzing workflow diagrams and visual project documentation to extract software requirements and generate Azure DevOps work items with proper dependency relationships.
 
 **CRITICAL: Workflow Arrow Analysis Instructions**
 1. **Identify arrows and connectors** in the image (→, ←, ↓, ↑, lines with direction)
@@ -160,10 +117,7 @@ Return your analysis as a JSON object with this structure:
 
 Focus on extracting actionable software development tasks, UI components, features, and technical requirements."""
 
-        # Create user prompt with description context emphasizing dependency analysis
-        user_prompt = f"""Analyze this workflow diagram/image with SPECIAL FOCUS on arrows and dependency relationships.
-
-{f'Additional context: {description}' if description else 'No additional context provided.'}
+ANALYSIS_USER_PREAMBLE = """Analyze this workflow diagram/image with SPECIAL FOCUS on arrows and dependency relationships.
 
 **PRIORITY ANALYSIS TASKS:**
 1. **Look for arrows/connectors** - identify direction and flow (→, ←, ↓, ↑, lines)
@@ -182,127 +136,641 @@ Focus on extracting actionable software development tasks, UI components, featur
 
 Return the analysis as structured JSON focusing on the workflow hierarchy."""
 
-        # Make the API call
-        response = client.chat.completions.create(
-            messages=[
-                {
-                    "role": "system",
-                    "content": system_prompt
+
+# JSON schema the analysis response must follow (the structure described in
+# ANALYSIS_SYSTEM_PROMPT); strict mode makes the model emit exactly this shape
+_PRIORITY_SCHEMA = {"type": "string", "enum": ["High", "Medium", "Low"]}
+ANALYSIS_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "ado_image_analysis",
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "properties": {
+                "project_name": {"type": "string"},
+                "workflow_analysis": {
+                    "type": "object",
+                    "properties": {
+                        "arrows_detected": {"type": "boolean"},
+                        "main_workflow_start": {"type": "string"},
+                        "dependency_sequence": {"type": "array", "items": {"type": "string"}},
+                        "flow_direction": {"type": "string"}
+                    },
+                    "required": ["arrows_detected", "main_workflow_start", "dependency_sequence", "flow_direction"],
+                    "additionalProperties": False
                 },
-                {
-                    "role": "user",
-                    "content": [
-                        {
-                            "type": "text",
-                            "text": user_prompt
-                        },
-                        {
-                            "type": "image_url",
-                            "image_url": {
-                                "url": f"data:image/jpeg;base64,{image_base64}"
+                "features": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "name": {"type": "string"},
+                            "description": {"type": "string"},
+                            "priority": _PRIORITY_SCHEMA,
+                            "is_main_epic": {"type": "boolean"},
+                            "requirements": {
+                                "type": "array",
+                                "items": {
+                                    "type": "object",
+                                    "properties": {
+                                        "title": {"type": "string"},
+                                        "description": {"type": "string"},
+                                        "priority": _PRIORITY_SCHEMA
+                                    },
+                                    "required": ["title", "description", "priority"],
+                                    "additionalProperties": False
+                                }
                             }
-                        }
-                    ]
-                }
-            ],
-            max_completion_tokens=40000,
-            model=deployment
-            # Note: o4-mini-imagebot only supports default temperature (1.0)
-        )
+                        },
+                        "required": ["name", "description", "priority", "is_main_epic", "requirements"],
+                        "additionalProperties": False
+                    }
+                },
+                "analysis_notes": {"type": "string"}
+            },
+            "required": ["project_name", "workflow_analysis", "features", "analysis_notes"],
+            "additionalProperties": False
+        }
+    }
+}
+
+
+def _azure_openai_settings() -> Optional[Tuple[str, str, str]]:
+    """Get (endpoint, api_key, api_version) from the cached configuration, or None if incomplete"""
+    config = _azure_openai_config()
+    endpoint = config["endpoint"]
+    api_key = config["api_key"]
+    
+    if not endpoint or not api_key:
+        logger.warning("Azure OpenAI configuration missing. Image processing will be unavailable.")
+        return None
+    return endpoint, api_key, config["api_version"]
+
+
+def get_azure_openai_client() -> Optional["AzureOpenAI"]:
+    """
+    Get the Azure OpenAI client for the current environment configuration
+    
+    The client is built once per configuration and reused, so every call shares
+    one HTTP connection pool (keep-alive) instead of reconnecting. The openai
+    SDK is imported lazily because it dominates server start-up time and
+    text-only tools never need it.
+    
+    Returns:
+        AzureOpenAI client instance or None if configuration is missing
+    """
+    settings = _azure_openai_settings()
+    if settings is None:
+        return None
+    
+    try:
+        return _create_azure_openai_client(*settings)
+    except Exception as e:
+        logger.error("Failed to initialize Azure OpenAI client: %s", e)
+        return None
+
+
+def get_async_azure_openai_client() -> Optional["AsyncAzureOpenAI"]:
+    """
+    Get the async Azure OpenAI client for the current environment configuration
+    
+    Cached like get_azure_openai_client, for use from async code.
+    
+    Returns:
+        AsyncAzureOpenAI client instance or None if configuration is missing
+    """
+    settings = _azure_openai_settings()
+    if settings is None:
+        return None
+    
+    try:
+        return _create_async_azure_openai_client(*settings)
+    except Exception as e:
+        logger.error("Failed to initialize async Azure OpenAI client: %s", e)
+        return None
+
+
+@lru_cache(maxsize=1)
+def _create_azure_openai_client(endpoint: str, api_key: str, api_version: str) -> "AzureOpenAI":
+    """Build the client for one configuration; cached so it is reused until the configuration changes"""
+    from openai import AzureOpenAI
+    
+    client = AzureOpenAI(
+        api_version=api_version,
+        azure_endpoint=endpoint,
+        api_key=api_key,
+    )
+    
+    logger.debug("Azure OpenAI client initialized successfully")
+    return client
+
+
+@lru_cache(maxsize=1)
+def _create_async_azure_openai_client(endpoint: str, api_key: str, api_version: str) -> "AsyncAzureOpenAI":
+    """Build the async client for one configuration; cached like _create_azure_openai_client"""
+    from openai import AsyncAzureOpenAI
+    
+    client = AsyncAzureOpenAI(
+        api_version=api_version,
+        azure_endpoint=endpoint,
+        api_key=api_key,
+    )
+    
+    logger.debug("Async Azure OpenAI client initialized successfully")
+    return client
+
+
+def is_azure_openai_configured() -> bool:
+    """Check whether the Azure OpenAI endpoint and key are set, without building a client"""
+    config = _azure_openai_config()
+    return bool(config["endpoint"] and config["api_key"])
+
+
+def load_image_as_base64(image_path: str) -> str:
+    """
+    Load an image file and convert it to base64 format
+    
+    Args:
+        image_path: Path to the image file
         
-        # Extract and parse the response
-        content = response.choices[0].message.content
+    Returns:
+        Base64 encoded image data
         
-        # Try to extract JSON from the response
+    Raises:
+        ValidationError: If image file cannot be loaded
+    """
+    try:
+        # One stat call answers both the existence and the size checks
         try:
-            # Look for JSON in the response
-            import re
-            json_match = re.search(r'\{.*\}', content, re.DOTALL)
-            if json_match:
-                analysis_result = json.loads(json_match.group())
+            file_stat = os.stat(image_path)
+        except FileNotFoundError:
+            file_stat = None
+        if file_stat is None or not S_ISREG(file_stat.st_mode):
+            raise ValidationError(f"Image file not found: {image_path}")
+            
+        # Check file extension
+        file_ext = os.path.splitext(image_path)[1].lower()
+        
+        if file_ext not in SUPPORTED_IMAGE_EXTENSIONS:
+            raise ValidationError(
+                f"Unsupported image format: {file_ext}. Supported: {', '.join(sorted(SUPPORTED_IMAGE_EXTENSIONS))}"
+            )
+            
+        # Check file size (limit to 10MB)
+        file_size = file_stat.st_size
+        if file_size > MAX_IMAGE_SIZE_BYTES:
+            raise ValidationError(f"Image file too large: {file_size / (1024*1024):.1f}MB. Maximum: 10MB")
+            
+        # A JPEG re-encode is usually several times smaller than PNG/BMP input,
+        # which cuts upload size and image tokens; keep it only if it is smaller
+        jpeg_data = None
+        if file_size and (file_ext in JPEG_RECOMPRESS_EXTENSIONS or file_size > JPEG_RECOMPRESS_MIN_BYTES):
+            jpeg_data = _recompress_as_jpeg(image_path)
+            if jpeg_data is not None and len(jpeg_data) >= file_size:
+                jpeg_data = None
+        
+        # Otherwise encode straight from a memory map to avoid copying the file into a bytes
+        # object first (an empty file can't be mapped, and encodes to an empty string anyway)
+        base64_image = ""
+        if jpeg_data is not None:
+            base64_image = b64encode(jpeg_data).decode('ascii')
+        elif file_size:
+            with open(image_path, 'rb') as image_file, \
+                    mmap.mmap(image_file.fileno(), 0, access=mmap.ACCESS_READ) as image_data:
+                base64_image = b64encode(image_data).decode('ascii')
+            
+        logger.debug("Image loaded successfully: %s (%.1fKB)", os.path.basename(image_path), file_size / 1024)
+        return base64_image
+        
+    except Exception as e:
+        raise ValidationError(f"Failed to load image: {str(e)}")
+
+
+def _recompress_as_jpeg(image_path: str) -> Optional[bytes]:
+    """
+    Re-encode an image as JPEG with Pillow
+    
+    Pillow is optional and imported on first use; transparent areas are
+    flattened onto white so diagrams keep a light background.
+    
+    Returns:
+        JPEG data, or None if Pillow is unavailable or the image can't be converted
+    """
+    try:
+        from PIL import Image
+    except ImportError:
+        return None
+    
+    try:
+        with Image.open(image_path) as image:
+            if image.mode in ('RGBA', 'LA', 'PA') or 'transparency' in image.info:
+                rgba = image.convert('RGBA')
+                rgb = Image.new('RGB', rgba.size, (255, 255, 255))
+                rgb.paste(rgba, mask=rgba.getchannel('A'))
             else:
-                # Fallback: create structured response from text
-                analysis_result = {
-                    "project_name": "Analyzed Project",
-                    "features": [
-                        {
-                            "name": "Image Analysis Result",
-                            "description": clean_text(content),
-                            "priority": "Medium",
-                            "requirements": [
-                                {
-                                    "title": "Implement analyzed features",
-                                    "description": "Based on image analysis findings",
-                                    "priority": "Medium"
-                                }
-                            ]
+                rgb = image.convert('RGB')
+        
+        buffer = io.BytesIO()
+        rgb.save(buffer, format='JPEG', quality=JPEG_QUALITY, optimize=True)
+        return buffer.getvalue()
+    except Exception as e:
+        logger.debug("JPEG re-encoding skipped for %s: %s", image_path, e)
+        return None
+
+
+# Base64 form of each supported format's leading file signature bytes
+_BASE64_SIGNATURE_MIME_TYPES = (
+    ('iVBORw0KGgo', 'image/png'),
+    ('/9j/', 'image/jpeg'),
+    ('R0lGOD', 'image/gif'),
+    ('UklGR', 'image/webp'),
+    ('Qk', 'image/bmp'),
+)
+
+# Characters that can change brace depth or string state while scanning JSON
+_JSON_STRUCTURE_RE = re.compile(r'[{}"\\]')
+
+
+class _JsonObjectScanner:
+    """
+    Incrementally locate the first complete top-level JSON object in streamed text
+    
+    Text is fed in pieces as it arrives; brace depth is tracked outside of JSON
+    strings (honoring escapes) so the object's end is known as soon as its
+    closing brace streams in. Offsets refer to the concatenation of all pieces.
+    """
+    __slots__ = ('start', 'end', '_depth', '_in_string', '_skip_first', '_offset')
+    
+    def __init__(self):
+        self.start = -1
+        self.end = -1
+        self._depth = 0
+        self._in_string = False
+        self._skip_first = False
+        self._offset = 0
+    
+    def feed(self, text: str) -> bool:
+        """Scan the next piece of text; returns True once the object is complete"""
+        if self.end >= 0:
+            return True
+        
+        offset = self._offset
+        self._offset += len(text)
+        # Position of a character escaped by the preceding backslash
+        escaped = 0 if self._skip_first else -1
+        self._skip_first = False
+        
+        for match in _JSON_STRUCTURE_RE.finditer(text):
+            index = match.start()
+            if index == escaped:
+                continue
+            char = match.group()
+            if self._in_string:
+                if char == '\\':
+                    escaped = index + 1
+                elif char == '"':
+                    self._in_string = False
+            elif char == '{':
+                if self._depth == 0:
+                    self.start = offset + index
+                self._depth += 1
+            elif self._depth == 0:
+                # Text before the object (quotes or stray braces in prose)
+                continue
+            elif char == '"':
+                self._in_string = True
+            elif char == '}':
+                self._depth -= 1
+                if self._depth == 0:
+                    self.end = offset + index + 1
+                    return True
+        
+        # A trailing backslash escapes the first character of the next piece
+        self._skip_first = escaped == len(text)
+        return False
+
+
+def estimate_base64_size(image_base64: str) -> int:
+    """
+    Compute the decoded size of base64 data without decoding it
+    
+    Args:
+        image_base64: Base64 encoded data, optionally as a data URL
+        
+    Returns:
+        Number of bytes the data decodes to
+    """
+    # Skip a "data:<mime>;base64," header without slicing the payload
+    start = image_base64.find(',', 0, 256) + 1 if image_base64.startswith('data:') else 0
+    padding = image_base64[-2:].count('=')
+    return (len(image_base64) - start) * 3 // 4 - padding
+
+
+def image_data_url(image_base64: str) -> str:
+    """
+    Build the data URL sent to the model for base64 image data
+    
+    The MIME type is taken from the image's file signature (JPEG if it isn't
+    recognized). Input that is already a data URL is passed through as is,
+    avoiding another copy of a multi-megabyte payload.
+    
+    Args:
+        image_base64: Base64 encoded image data, or a complete data URL
+        
+    Returns:
+        Data URL for the image
+    """
+    if image_base64.startswith('data:'):
+        return image_base64
+    mime_type = next(
+        (mime for prefix, mime in _BASE64_SIGNATURE_MIME_TYPES if image_base64.startswith(prefix)),
+        'image/jpeg'
+    )
+    return "data:" + mime_type + ";base64," + image_base64
+
+
+def _log_prompt_cache_usage(usage) -> None:
+    """Log how many prompt tokens were served from the Azure OpenAI prompt cache"""
+    details = getattr(usage, 'prompt_tokens_details', None)
+    cached_tokens = getattr(details, 'cached_tokens', None) or 0
+    logger.debug("Prompt tokens: %d (%d cached)", usage.prompt_tokens, cached_tokens)
+
+
+def _analysis_request(image_base64: str, description: str) -> Dict[str, Any]:
+    """Build the chat completion arguments for analyzing an image"""
+    # Variable context goes after the static preamble so the prompt prefix stays cacheable
+    context_text = f"Additional context: {description}" if description else "No additional context provided."
+    
+    return {
+        "messages": [
+            {
+                "role": "system",
+                "content": ANALYSIS_SYSTEM_PROMPT
+            },
+            {
+                "role": "user",
+                "content": [
+                    {
+                        "type": "text",
+                        "text": ANALYSIS_USER_PREAMBLE
+                    },
+                    {
+                        "type": "text",
+                        "text": context_text
+                    },
+                    {
+                        "type": "image_url",
+                        "image_url": {
+                            "url": image_data_url(image_base64)
                         }
-                    ],
-                    "analysis_notes": "Azure OpenAI analysis completed"
-                }
-                
-        except json.JSONDecodeError:
-            # Fallback for non-JSON responses
+                    }
+                ]
+            }
+        ],
+        "max_completion_tokens": 40000,
+        "model": _azure_openai_config()["deployment"],
+        # Constrain decoding to the analysis schema so the output is always parseable JSON
+        "response_format": ANALYSIS_RESPONSE_FORMAT,
+        # Stream the answer so it is collected while the model is still generating
+        "stream": True,
+        # Final chunk reports token usage, including prompt cache hits
+        "stream_options": {"include_usage": True}
+        # Note: o4-mini-imagebot only supports default temperature (1.0)
+    }
+
+
+def _collect_chunk(chunk, parts: List[str], scanner: _JsonObjectScanner) -> None:
+    """
+    Add one streamed chunk to the response
+    
+    Text after the JSON object has closed is not kept or scanned. The stream
+    is still read to the end, since the usage chunk only arrives last (after
+    the finish chunk under structured outputs).
+    """
+    if chunk.usage is not None:
+        _log_prompt_cache_usage(chunk.usage)
+    if not chunk.choices or scanner.end >= 0:
+        return
+    text = chunk.choices[0].delta.content
+    if text:
+        parts.append(text)
+        scanner.feed(text)
+
+
+def _parse_analysis_content(content: str, scanner: _JsonObjectScanner) -> Dict:
+    """
+    Turn the model's response into an analysis dict
+    
+    The response format makes the model return schema-conforming JSON; the text
+    summary fallbacks only cover refusals and output cut off at the token limit.
+    """
+    try:
+        # The scanner has already located the first complete JSON object
+        # while streaming, so the response isn't searched again
+        if scanner.end >= 0:
+            analysis_result = fast_json_loads(content[scanner.start:scanner.end])
+        else:
+            # Fallback: create structured response from text
             analysis_result = {
-                "project_name": "Image Analysis Project",
+                "project_name": "Analyzed Project",
                 "features": [
                     {
-                        "name": "Visual Requirements",
-                        "description": clean_text(content[:500]) + "..." if len(content) > 500 else clean_text(content),
+                        "name": "Image Analysis Result",
+                        "description": clean_text(content),
                         "priority": "Medium",
                         "requirements": [
                             {
-                                "title": "Implement visual requirements",
-                                "description": "Based on image analysis",
+                                "title": "Implement analyzed features",
+                                "description": "Based on image analysis findings",
                                 "priority": "Medium"
                             }
                         ]
                     }
                 ],
-                "analysis_notes": f"Analysis completed. Response length: {len(content)} characters"
+                "analysis_notes": "Azure OpenAI analysis completed"
             }
+            
+    except json.JSONDecodeError:
+        # Fallback for non-JSON responses
+        analysis_result = {
+            "project_name": "Image Analysis Project",
+            "features": [
+                {
+                    "name": "Visual Requirements",
+                    "description": clean_text(content[:500]) + "..." if len(content) > 500 else clean_text(content),
+                    "priority": "Medium",
+                    "requirements": [
+                        {
+                            "title": "Implement visual requirements",
+                            "description": "Based on image analysis",
+                            "priority": "Medium"
+                        }
+                    ]
+                }
+            ],
+            "analysis_notes": f"Analysis completed. Response length: {len(content)} characters"
+        }
+    
+    logger.debug("Azure OpenAI image analysis completed: %d features identified",
+                 len(analysis_result.get('features', [])))
+    
+    return analysis_result
+
+
+def _check_image_size(image_base64: str) -> None:
+    """Reject images above MAX_IMAGE_SIZE_BYTES before they are sent for analysis"""
+    image_size = estimate_base64_size(image_base64)
+    if image_size > MAX_IMAGE_SIZE_BYTES:
+        raise ValidationError(f"Image too large: {image_size / (1024*1024):.1f}MB. Maximum: 10MB")
+
+
+def analyze_image_with_azure_openai(
+    image_base64: str, description: str = "", client: Optional["AzureOpenAI"] = None
+) -> Dict:
+    """
+    Analyze an image using Azure OpenAI vision capabilities
+    
+    Args:
+        image_base64: Base64 encoded image data
+        description: Optional description or context about the image
+        client: Client to use instead of the shared one (e.g. for a batch of images)
+        
+    Returns:
+        Dictionary containing analysis results and extracted features
+        
+    Raises:
+        ValidationError: If analysis fails or Azure OpenAI is unavailable
+    """
+    _check_image_size(image_base64)
+        
+    if client is None:
+        client = get_azure_openai_client()
+    if not client:
+        raise ValidationError("Azure OpenAI client not available. Check configuration.")
+        
+    try:
+        stream = client.chat.completions.create(**_analysis_request(image_base64, description))
+        
+        parts = []
+        scanner = _JsonObjectScanner()
+        with stream:
+            for chunk in stream:
+                _collect_chunk(chunk, parts, scanner)
+        
+        return _parse_analysis_content("".join(parts), scanner)
+        
+    except Exception as e:
+        raise ValidationError(f"Azure OpenAI image analysis failed: {str(e)}")
+
+
+async def analyze_image_with_azure_openai_async(
+    image_base64: str, description: str = "", client: Optional["AsyncAzureOpenAI"] = None
+) -> Dict:
+    """
+    Async version of analyze_image_with_azure_openai for use from async handlers
+    
+    The request goes through the async client, and responses longer than
+    ASYNC_PARSE_THRESHOLD_CHARS are parsed in a worker thread so other requests
+    keep running meanwhile.
+    
+    Args:
+        image_base64: Base64 encoded image data
+        description: Optional description or context about the image
+        client: Async client to use instead of the shared one
+        
+    Returns:
+        Dictionary containing analysis results and extracted features
         
-        print(f"✅ Azure OpenAI image analysis completed")
-        print(f"📊 Identified {len(analysis_result.get('features', []))} features")
+    Raises:
+        ValidationError: If analysis fails or Azure OpenAI is unavailable
+    """
+    _check_image_size(image_base64)
+    
+    if client is None:
+        client = get_async_azure_openai_client()
+    if not client:
+        raise ValidationError("Azure OpenAI client not available. Check configuration.")
+    
+    try:
+        stream = await client.chat.completions.create(**_analysis_request(image_base64, description))
+        
+        parts = []
+        scanner = _JsonObjectScanner()
+        async with stream:
+            async for chunk in stream:
+                _collect_chunk(chunk, parts, scanner)
         
-        return analysis_result
+        content = "".join(parts)
+        if len(content) > ASYNC_PARSE_THRESHOLD_CHARS:
+            return await asyncio.to_thread(_parse_analysis_content, content, scanner)
+        return _parse_analysis_content(content, scanner)
         
     except Exception as e:
         raise ValidationError(f"Azure OpenAI image analysis failed: {str(e)}")
 
 
-def extract_features_from_image(image_base64: str, description: str = "") -> List[Dict]:
+def extract_features_from_image(
+    image_base64: str, description: str = "", client: Optional["AzureOpenAI"] = None
+) -> List[Dict]:
     """
     Extract project features from image using Azure OpenAI
     
     Args:
         image_base64: Base64 encoded image data
         description: Optional description context
+        client: Client to use instead of the shared one
         
     Returns:
         List of features extracted from the image
     """
     try:
-        analysis = analyze_image_with_azure_openai(image_base64, description)
+        analysis = analyze_image_with_azure_openai(image_base64, description, client)
         features = analysis.get('features', [])
         
-        # Enhance features with better priority detection
+        # Enhance features with better priority detection; only Medium (the
+        # default) is revisited, and the text classifier caches per description
         for feature in features:
-            if 'requirements' in feature:
-                for req in feature['requirements']:
-                    if req.get('priority') == 'Medium':  # Default, try to improve
-                        improved_priority = determine_priority_from_text(req.get('description', ''))
-                        if improved_priority != Priority.MEDIUM:
-                            req['priority'] = improved_priority.value
+            for req in feature.get('requirements', ()):
+                if req.get('priority') == 'Medium':  # Default, try to improve
+                    # The classifier returns a level: 3 for high priority, 2 otherwise
+                    if determine_priority_from_text(req.get('description', '')) >= 3:
+                        req['priority'] = Priority.HIGH.value
                             
         return features
         
     except Exception as e:
-        print(f"⚠️ Feature extraction failed: {e}")
+        logger.warning("Feature extraction failed: %s", e)
         return []
 
 
-def process_image_with_azure_openai(image_base64: str, description: str = "") -> ADOInstructions:
+def _workflow_task(req: Dict, step_index: int, task_id: str, parent_id: str, sequence: Sequence[str]) -> WorkItem:
+    """Build the Task for one workflow step (requirement) of the main epic"""
+    step = step_index + 1
+    
+    # Task description lines, joined once: description, sequence information,
+    # then the shared acceptance criteria
+    description_lines = [clean_text(req.get('description', ''))]
+    
+    # Include sequence information
+    if step_index < len(sequence):
+        description_lines.append(f"Workflow Step {step} of {len(sequence)}: {sequence[step_index]}")
+    description_lines.append(TASK_ACCEPTANCE_CRITERIA)
+    
+    return WorkItem(
+        id=task_id,
+        title=clean_text(req.get('title', f'Workflow Step {step}')),
+        description="\n".join(description_lines),
+        work_item_type=WorkItemType.TASK,
+        priority=PRIORITY_BY_VALUE.get(req.get('priority', 'Medium').title(), Priority.MEDIUM),
+        parent_id=parent_id,
+        tags=["workflow-step", "dependency-task", f"step-{step}"]
+    )
+
+
+def process_image_with_azure_openai(
+    image_base64: str, description: str = "", client: Optional["AzureOpenAI"] = None
+) -> ADOInstructions:
     """
     Process an image using Azure OpenAI vision capabilities and generate ADO work items with dependency analysis.
     
@@ -315,6 +783,7 @@ def process_image_with_azure_openai(image_base64: str, description: str = "") ->
     Args:
         image_base64: Base64 encoded image data
         description: Optional description or context about the image
+        client: Client to use instead of the shared one
         
     Returns:
         ADOInstructions object containing structured work items
@@ -344,7 +813,7 @@ def process_image_with_azure_openai(image_base64: str, description: str = "") ->
     """
     try:
         # Get analysis from Azure OpenAI with dependency parsing
-        analysis = analyze_image_with_azure_openai(image_base64, description)
+        analysis = analyze_image_with_azure_openai(image_base64, description, client)
         
         project_name = analysis.get('project_name', 'Workflow Analysis Project')
         features = analysis.get('features', [])
@@ -363,50 +832,33 @@ def process_image_with_azure_openai(image_base64: str, description: str = "") ->
             
             if is_main_epic or main_epic is None:  # Create main epic
                 epic_id = f"epic_{len(work_items) + 1}"
+                
+                # Only build the default description when the analysis didn't supply one
+                epic_description = feature_data.get('description')
+                if epic_description is None:
+                    epic_description = EPIC_DEFAULT_DESCRIPTION_TEMPLATE.format(
+                        flow_direction=workflow_analysis.get('flow_direction', 'sequential')
+                    )
+                
                 main_epic = WorkItem(
                     id=epic_id,
                     title=clean_text(feature_data.get('name', 'Workflow Implementation')),
-                    description=clean_text(feature_data.get('description', 
-                        f"Main workflow implementation based on dependency analysis. "
-                        f"Flow detected: {workflow_analysis.get('flow_direction', 'sequential')}. "
-                        f"Acceptance Criteria: Complete workflow implementation following visual dependency chain, "
-                        f"all workflow steps properly integrated, dependencies correctly implemented in sequence.")),
+                    description=clean_text(epic_description),
                     work_item_type=WorkItemType.EPIC,
-                    priority=Priority(feature_data.get('priority', 'High').title()),
+                    priority=PRIORITY_BY_VALUE.get(feature_data.get('priority', 'High').title(), Priority.HIGH),
                     tags=["workflow", "dependency-chain", "epic"]
                 )
                 work_items.append(main_epic)
                 
-                # Create Tasks for workflow steps (requirements)
+                # Create Tasks for workflow steps (requirements); the step sequence
+                # and numbering are resolved once rather than per task
                 requirements = feature_data.get('requirements', [])
-                for i, req in enumerate(requirements):
-                    # Add dependency context to task description
-                    task_description = clean_text(req.get('description', ''))
-                    depends_on = req.get('depends_on', '')
-                    if depends_on:
-                        task_description += f"\n\nDependency: This task depends on completion of '{depends_on}'"
-                    
-                    # Include sequence information
-                    sequence_info = ""
-                    if workflow_analysis.get('dependency_sequence'):
-                        seq = workflow_analysis['dependency_sequence']
-                        if i < len(seq):
-                            sequence_info = f"\nWorkflow Step {i+1} of {len(seq)}: {seq[i]}"
-                    
-                    task_id = f"task_{len(work_items) + 1}"
-                    task = WorkItem(
-                        id=task_id,
-                        title=clean_text(req.get('title', f'Workflow Step {i+1}')),
-                        description=task_description + sequence_info + 
-                                   f"\nAcceptance Criteria: Implementation follows workflow dependencies, "
-                                   f"integration with previous workflow steps is verified, "
-                                   f"code is properly tested, documentation includes dependency information.",
-                        work_item_type=WorkItemType.TASK,
-                        priority=Priority(req.get('priority', 'Medium').title()),
-                        parent_id=main_epic.id,
-                        tags=["workflow-step", "dependency-task", f"step-{i+1}"]
-                    )
-                    work_items.append(task)
+                sequence = workflow_analysis.get('dependency_sequence') or ()
+                first_task_number = len(work_items) + 1
+                work_items.extend([
+                    _workflow_task(req, i, f"task_{first_task_number + i}", main_epic.id, sequence)
+                    for i, req in enumerate(requirements)
+                ])
                 
                 # Only create one main epic from workflow analysis
                 break
@@ -418,7 +870,7 @@ def process_image_with_azure_openai(image_base64: str, description: str = "") ->
             work_items=work_items
         )
         
-        print(f"✅ Generated {len(work_items)} work items from image analysis")
+        logger.debug("Generated %d work items from image analysis", len(work_items))
         
         # Display comprehensive summary
         print_ado_summary(ado_instructions, "Azure OpenAI Image Analysis Results")
@@ -429,14 +881,17 @@ def process_image_with_azure_openai(image_base64: str, description: str = "") ->
         raise ValidationError(f"Image processing failed: {str(e)}")
 
 
-@safe_operation
-def analyze_workflow_diagram(image_base64: str, description: str = "") -> Dict:
+@safe_operation("workflow diagram analysis")
+def analyze_workflow_diagram(
+    image_base64: str, description: str = "", client: Optional["AzureOpenAI"] = None
+) -> Dict:
     """
     Specialized function for analyzing workflow diagrams
     
     Args:
         image_base64: Base64 encoded image data
         description: Optional description context
+        client: Client to use instead of the shared one
         
     Returns:
         Dictionary containing workflow analysis results
@@ -445,7 +900,7 @@ def analyze_workflow_diagram(image_base64: str, description: str = "") -> Dict:
         # Use enhanced prompt for workflow analysis
         workflow_description = f"Workflow diagram analysis: {description}" if description else "Workflow diagram showing project structure and dependencies"
         
-        analysis = analyze_image_with_azure_openai(image_base64, workflow_description)
+        analysis = analyze_image_with_azure_openai(image_base64, workflow_description, client)
         
         # Add workflow-specific processing
         workflow_info = {
@@ -476,7 +931,7 @@ def analyze_workflow_diagram(image_base64: str, description: str = "") -> Dict:
         }
         
     except Exception as e:
-        return standardize_error_response(f"Workflow analysis failed: {str(e)}")
+        return standardize_error_response(e, "Workflow analysis failed")
 
 
 def format_image_analysis_result(analysis_result: Dict) -> str:
@@ -528,23 +983,23 @@ def format_image_analysis_result(analysis_result: Dict) -> str:
 # Utility functions for image processing
 def validate_image_format(image_path: str) -> bool:
     """Check if image format is supported"""
-    supported_extensions = {'.png', '.jpg', '.jpeg', '.gif', '.bmp', '.webp'}
-    return Path(image_path).suffix.lower() in supported_extensions
+    return os.path.splitext(image_path)[1].lower() in SUPPORTED_IMAGE_EXTENSIONS
 
 
 def get_image_info(image_path: str) -> Dict:
     """Get basic information about an image file"""
     try:
-        if not os.path.exists(image_path):
+        try:
+            file_stat = os.stat(image_path)
+        except FileNotFoundError:
             return {"error": "File not found"}
             
-        stat = os.stat(image_path)
         return {
             "path": image_path,
-            "name": Path(image_path).name,
-            "size_bytes": stat.st_size,
-            "size_mb": round(stat.st_size / (1024 * 1024), 2),
-            "extension": Path(image_path).suffix.lower(),
+            "name": os.path.basename(image_path),
+            "size_bytes": file_stat.st_size,
+            "size_mb": round(file_stat.st_size / (1024 * 1024), 2),
+            "extension": os.path.splitext(image_path)[1].lower(),
             "supported": validate_image_format(image_path)
         }
     except Exception as e:
@@ -5,30 +5,68 @@ This module contains all the data classes, enums, and type definitions
 used throughout the ADO instruction generation system.
 """
 
-from typing import Any, Dict, List, Optional
-from dataclasses import dataclass
-from enum import Enum
+from typing import Any, Dict, List, Optional, Tuple
+from dataclasses import dataclass, field
+from enum import StrEnum
 
+from .common_utils import fast_json_dumps
 
-class WorkItemType(Enum):
-    """Enumeration of Azure DevOps work item types"""
+
+class WorkItemType(StrEnum):
+    """
+    Enumeration of Azure DevOps work item types
+    
+    Members are str instances, so they serialize and compare as their values
+    """
     EPIC = "Epic"
     TASK = "Task"
     USER_STORY = "User Story"
     BUG = "Bug"
 
 
-class Priority(Enum):
-    """Priority levels for work items"""
+class Priority(StrEnum):
+    """Priority levels for work items (str members, like WorkItemType)"""
     LOW = "Low"
     MEDIUM = "Medium"
     HIGH = "High"
     CRITICAL = "Critical"
 
 
-@dataclass
+# Value → member lookups, for converting external strings without Enum's
+# raise-on-unknown constructor (use .get with a default)
+WORK_ITEM_TYPE_BY_VALUE = {item_type.value: item_type for item_type in WorkItemType}
+PRIORITY_BY_VALUE = {priority.value: priority for priority in Priority}
+
+
+def split_epics_and_tasks(work_items: List["WorkItem"]) -> Tuple[List["WorkItem"], List["WorkItem"]]:
+    """
+    Split work items into Epics and Tasks in a single pass
+    
+    Args:
+        work_items: Work items in their generated order
+        
+    Returns:
+        Tuple of (epics, tasks), each in the original order; other item types are skipped
+    """
+    epic_type, task_type = WorkItemType.EPIC, WorkItemType.TASK
+    epics, tasks = [], []
+    for item in work_items:
+        item_type = item.work_item_type
+        if item_type is epic_type:
+            epics.append(item)
+        elif item_type is task_type:
+            tasks.append(item)
+    return epics, tasks
+
+
+@dataclass(frozen=True, slots=True)
 class WorkItem:
-    """Represents a single Azure DevOps work item"""
+    """
+    Represents a single Azure DevOps work item
+    
+    Work items are immutable once built; use dataclasses.replace to derive a
+    modified copy. This lets to_dict build its dictionary only once.
+    """
     id: str
     title: str
     work_item_type: WorkItemType
@@ -36,23 +74,62 @@ class WorkItem:
     priority: Priority
     tags: List[str]
     parent_id: Optional[str] = None
+    _dict_cache: Optional[Dict[str, Any]] = field(default=None, init=False, repr=False, compare=False)
+
+    def json_fields(self) -> Dict[str, Any]:
+        """
+        Dictionary of fields for JSON encoders (memoized; must not be modified)
+        
+        Serializers use this instead of to_dict to skip the defensive copy.
+        """
+        if self._dict_cache is None:
+            object.__setattr__(self, '_dict_cache', {
+                "id": self.id,
+                "title": self.title,
+                "work_item_type": self.work_item_type,
+                "description": self.description,
+                "priority": self.priority,
+                "tags": self.tags,
+                "parent_id": self.parent_id
+            })
+        return self._dict_cache
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert work item to dictionary format"""
-        return {
-            "id": self.id,
-            "title": self.title,
-            "work_item_type": self.work_item_type.value,
-            "description": self.description,
-            "priority": self.priority.value,
-            "tags": self.tags,
-            "parent_id": self.parent_id
-        }
+        # Hand out a copy so callers can't alter the memoized dictionary
+        return dict(self.json_fields())
 
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "WorkItem":
+        """
+        Build a work item from a dictionary in to_dict format
+        
+        Missing optional fields get empty defaults; unknown work item types and
+        priorities fall back to Task and Medium.
+        
+        Args:
+            data: Work item dictionary, e.g. parsed from tool output
+            
+        Returns:
+            WorkItem built from the dictionary
+            
+        Raises:
+            KeyError: If the title is missing
+        """
+        return cls(
+            id=str(data.get("id", "")),
+            title=data["title"],
+            work_item_type=WORK_ITEM_TYPE_BY_VALUE.get(data.get("work_item_type"), WorkItemType.TASK),
+            description=data.get("description", ""),
+            priority=PRIORITY_BY_VALUE.get(data.get("priority"), Priority.MEDIUM),
+            tags=list(data.get("tags") or ()),
+            parent_id=data.get("parent_id")
+        )
 
-@dataclass
+
+@dataclass(slots=True)
 class ADOInstructions:
-    """Complete set of ADO work item instructions"""
+    """Complete set of ADO work item instructions (slotted, like WorkItem)"""
     project_name: str
     work_items: List[WorkItem]
     organization_context: str
@@ -65,6 +142,61 @@ class ADOInstructions:
             "organization_context": self.organization_context
         }
 
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ADOInstructions":
+        """
+        Build instructions from a dictionary
+        
+        Accepts the to_dict format (a flat "work_items" list) and the nested
+        "epics" format checked by validate_ado_structure, where each epic holds
+        its "tasks". Nested items without ids get positional ones
+        ("epic-1", "epic-1-task-1") so tasks stay linked to their epic.
+        
+        Args:
+            data: Instructions dictionary, e.g. parsed from tool input
+            
+        Returns:
+            ADOInstructions built from the dictionary
+            
+        Raises:
+            KeyError: If the project name or a work item title is missing
+        """
+        if "work_items" in data:
+            work_items = [WorkItem.from_dict(item) for item in data["work_items"]]
+        else:
+            work_items = []
+            for i, epic in enumerate(data.get("epics", ()), 1):
+                epic_id = str(epic.get("id") or f"epic-{i}")
+                work_items.append(WorkItem.from_dict(
+                    {**epic, "id": epic_id, "work_item_type": WorkItemType.EPIC, "parent_id": None}
+                ))
+                for j, task in enumerate(epic.get("tasks", ()), 1):
+                    work_items.append(WorkItem.from_dict(
+                        {**task, "id": task.get("id") or f"{epic_id}-task-{j}", "parent_id": epic_id}
+                    ))
+        return cls(
+            project_name=data["project_name"],
+            work_items=work_items,
+            organization_context=data.get("organization_context", ORGANIZATION_CONTEXT)
+        )
+
+    def json_fields(self) -> Dict[str, Any]:
+        """
+        Shallow dictionary of fields for JSON encoders
+        
+        Work items are left as objects for the encoder to convert through their
+        own json_fields, so no per-item dictionaries are copied.
+        """
+        return {
+            "project_name": self.project_name,
+            "work_items": self.work_items,
+            "organization_context": self.organization_context
+        }
+
+    def to_json(self) -> str:
+        """Serialize instructions to an indented JSON string"""
+        return fast_json_dumps(self)
+
 
 # Organization context and constants
 ORGANIZATION_CONTEXT = {
@@ -5,52 +5,153 @@ This module handles text analysis, feature extraction, and requirement parsing
 from various text inputs like meeting transcripts and user requirements.
 """
 
-from typing import List, Dict, Any
-from .common_utils import clean_text, extract_action_from_text
+import re
+from bisect import bisect_right
+from functools import lru_cache
+from itertools import accumulate
+from typing import List, Dict, Any, Tuple
+from .common_utils import clean_text, extract_action_from_text, compile_keyword_scanner, text_lru_cache
+
+
+# Common project/feature keywords and the feature each one produces
+PROJECT_KEYWORDS = {
+    'chatbot': 'Chatbot Development',
+    'bot': 'Bot Development', 
+    'chat': 'Chat System',
+    'dashboard': 'Dashboard',
+    'report': 'Reporting',
+    'analytics': 'Analytics',
+    'data pipeline': 'Data Pipeline',
+    'visualization': 'Data Visualization',
+    'api': 'API Development',
+    'integration': 'System Integration',
+    'authentication': 'Authentication',
+    'database': 'Database',
+    'etl': 'ETL Pipeline',
+    'website': 'Website Development',
+    'web app': 'Web Application',
+    'mobile app': 'Mobile Application',
+    'ai': 'AI/ML System',
+    'machine learning': 'Machine Learning',
+    'llm': 'LLM Integration'
+}
+
+# Terms that make a whole sentence worth keeping as a feature
+PROJECT_TERMS = ('database', 'llm', 'website', 'api', 'server', 'frontend', 'backend')
+
+# Verbs whose trailing words name the feature in an action sentence
+ACTION_TARGET_TRIGGERS = ('build', 'create', 'develop', 'implement', 'need')
+
+# Phrases that mark a sentence as a requirement
+REQUIREMENT_TRIGGERS = ('must', 'should', 'require', 'need to', 'shall')
+
+# Substrings that mark a feature as high priority
+HIGH_PRIORITY_KEYWORDS = ('security', 'authentication', 'data', 'database')
+
+# System components that suggest a dependency chain when several are mentioned
+WORKFLOW_TERMS = ('database', 'website', 'frontend', 'backend', 'api', 'server')
+
+# Logical build order of those components: Database → Backend/API → Frontend → Website
+WORKFLOW_TERM_ORDER = ('database', 'api', 'server', 'backend', 'frontend', 'website')
+
+# Compiled once per process: each scan is a single sweep over the text
+_PROJECT_KEYWORD_SCANNER = compile_keyword_scanner(PROJECT_KEYWORDS)
+_PROJECT_TERM_SCANNER = compile_keyword_scanner(PROJECT_TERMS)
+
+# The scanner reports the longest keyword at each position, so also credit
+# every keyword contained in it (e.g. 'chatbot' implies 'chat' and 'bot')
+_IMPLIED_KEYWORDS = {
+    keyword: frozenset(other for other in PROJECT_KEYWORDS if other in keyword)
+    for keyword in PROJECT_KEYWORDS
+}
+
+# Matches a whole sentence (up to the next '.', '!' or '?') that contains a requirement
+# trigger; anchored to sentence starts so failed sentences are skipped in one pass
+_REQUIREMENT_SENTENCE_RE = re.compile(
+    r'(?:^|(?<=[.!?]))[^.!?]*?(?:' + '|'.join(re.escape(t) for t in REQUIREMENT_TRIGGERS) + r')[^.!?]*',
+    re.IGNORECASE
+)
+
+# Finds any high priority keyword in one search instead of a Python-level loop
+_HIGH_PRIORITY_RE = re.compile('|'.join(re.escape(keyword) for keyword in HIGH_PRIORITY_KEYWORDS))
+
+# Maps sentence-ending punctuation to a single split character in one pass
+_SENTENCE_BREAKS = str.maketrans('.!?', '|||')
+
+# Common dependency chain indicators - more flexible patterns, each paired with
+# the connector it needs; clean_text collapses whitespace to single spaces, so a
+# pattern can only match when its connector appears literally in the text
+_CHAIN_PATTERNS = tuple((connector, re.compile(pattern)) for connector, pattern in (
+    ('→', r'([a-zA-Z][a-zA-Z\s]+?)\s*→\s*([a-zA-Z][a-zA-Z\s]+?)\s*→\s*([a-zA-Z][a-zA-Z\s]+)'),  # A → B → C
+    ('->', r'([a-zA-Z][a-zA-Z\s]+?)\s*->\s*([a-zA-Z][a-zA-Z\s]+?)\s*->\s*([a-zA-Z][a-zA-Z\s]+)'),  # A -> B -> C
+    (' to ', r'([a-zA-Z][a-zA-Z\s]+?)\s+to\s+([a-zA-Z][a-zA-Z\s]+?)\s+to\s+([a-zA-Z][a-zA-Z\s]+)'),  # A to B to C
+    (' then ', r'([a-zA-Z][a-zA-Z\s]+?)\s+then\s+([a-zA-Z][a-zA-Z\s]+?)\s+then\s+([a-zA-Z][a-zA-Z\s]+)'),  # A then B then C
+    (' leads to ', r'([a-zA-Z][a-zA-Z\s]+?)\s+leads\s+to\s+([a-zA-Z][a-zA-Z\s]+?)\s+leads\s+to\s+([a-zA-Z][a-zA-Z\s]+)')  # A leads to B leads to C
+))
+
+
+def _sentences_with_hits(scanner, text_lower: str, sentences_lower: List[str]) -> set:
+    """Return indices of the sentences containing a scanner hit, scanning the text once"""
+    # Sentences were split on single separator characters, so each one ends
+    # one character before the next begins
+    sentence_ends = list(accumulate(len(sentence) + 1 for sentence in sentences_lower))
+    return {bisect_right(sentence_ends, match.start()) for match in scanner.finditer(text_lower)}
 
 
 def extract_features_from_text(text: str) -> List[str]:
     """Extract main features from text input"""
+    if not text:
+        return []
+    return list(_extract_features(text))
+
+
+def extract_features_from_texts(texts: List[str]) -> List[List[str]]:
+    """
+    Extract main features from a batch of texts
+    
+    Identical texts in the batch are analyzed only once.
+    
+    Args:
+        texts: Text inputs such as several meeting transcripts
+        
+    Returns:
+        One feature list per input text, in input order
+    """
+    features_by_text: Dict[str, Tuple[str, ...]] = {}
+    for text in texts:
+        if text and text not in features_by_text:
+            features_by_text[text] = _extract_features(text)
+    return [list(features_by_text[text]) if text else [] for text in texts]
+
+
+@text_lru_cache(maxsize=512)
+def _extract_features(text: str) -> Tuple[str, ...]:
+    """Cached feature extraction; returns a tuple so cached results can't be mutated"""
     
     # Use common utility to clean text
     text = clean_text(text)
     if not text:
-        return []
+        return ()
     
-    features = []
+    # Insertion-ordered dict used as an ordered set: duplicates are dropped as they arrive
+    features: Dict[str, None] = {}
     text_lower = text.lower()
     
-    # Common project/feature keywords
-    project_keywords = {
-        'chatbot': 'Chatbot Development',
-        'bot': 'Bot Development', 
-        'chat': 'Chat System',
-        'dashboard': 'Dashboard',
-        'report': 'Reporting',
-        'analytics': 'Analytics',
-        'data pipeline': 'Data Pipeline',
-        'visualization': 'Data Visualization',
-        'api': 'API Development',
-        'integration': 'System Integration',
-        'authentication': 'Authentication',
-        'database': 'Database',
-        'etl': 'ETL Pipeline',
-        'website': 'Website Development',
-        'web app': 'Web Application',
-        'mobile app': 'Mobile Application',
-        'ai': 'AI/ML System',
-        'machine learning': 'Machine Learning',
-        'llm': 'LLM Integration'
-    }
+    # Check for project keywords in a single pass over the text
+    keyword_hits = set()
+    for match in _PROJECT_KEYWORD_SCANNER.finditer(text_lower):
+        keyword_hits.update(_IMPLIED_KEYWORDS[match.group(1)])
     
-    # Check for project keywords
-    for keyword, feature_name in project_keywords.items():
-        if keyword in text_lower:
-            features.append(feature_name)
+    for keyword, feature_name in PROJECT_KEYWORDS.items():
+        if keyword in keyword_hits:
+            features[feature_name] = None
     
     # Extract action-based features from sentences
-    sentences = text.replace('.', '|').replace('!', '|').replace('?', '|').split('|')
-    for sentence in sentences:
+    sentences = text.translate(_SENTENCE_BREAKS).split('|')
+    sentences_lower = text_lower.translate(_SENTENCE_BREAKS).split('|')
+    term_sentences = _sentences_with_hits(_PROJECT_TERM_SCANNER, text_lower, sentences_lower)
+    
+    for index, sentence in enumerate(sentences):
         sentence = sentence.strip()
         if not sentence:
             continue
@@ -58,51 +159,46 @@ def extract_features_from_text(text: str) -> List[str]:
         # Use common utility to extract actions
         action = extract_action_from_text(sentence)
         if action:
-            # Extract what comes after the action
-            sentence_lower = sentence.lower()
-            for pattern in ['build', 'create', 'develop', 'implement', 'need']:
-                if pattern in sentence_lower:
-                    remaining = sentence_lower.split(pattern, 1)
-                    if len(remaining) > 1:
-                        target = remaining[1].strip()
-                        if target:
-                            features.append(f"{action.title()} {target.title()}")
-                            break
+            # Extract what comes after the action, reusing the pre-lowered sentence
+            sentence_lower = sentences_lower[index].strip()
+            for trigger in ACTION_TARGET_TRIGGERS:
+                # One find both tests for the trigger and locates the target after it
+                position = sentence_lower.find(trigger)
+                if position >= 0:
+                    target = sentence_lower[position + len(trigger):].strip()
+                    if target:
+                        features[f"{action.title()} {target.title()}"] = None
+                        break
         
         # If sentence contains project-relevant terms, include it as a feature
-        if any(word in sentence.lower() for word in ['database', 'llm', 'website', 'api', 'server', 'frontend', 'backend']):
-            features.append(sentence.strip())
-    
-    # Remove duplicates while preserving order
-    unique_features = []
-    for feature in features:
-        if feature not in unique_features:
-            unique_features.append(feature)
+        if index in term_sentences:
+            features[sentence] = None
     
-    return unique_features
+    return tuple(features)
 
 
 def extract_requirements_from_text(text: str) -> List[str]:
     """Extract specific requirements from text input"""
+    if not text:
+        return []
+    return list(_extract_requirements(text))
+
+
+@text_lru_cache(maxsize=512)
+def _extract_requirements(text: str) -> Tuple[str, ...]:
+    """Cached requirement extraction; returns a tuple so cached results can't be mutated"""
     text = clean_text(text)
-    requirements = []
-    sentences = text.split('.')
-    
-    for sentence in sentences:
-        sentence = sentence.strip()
-        if any(keyword in sentence.lower() for keyword in ['must', 'should', 'require', 'need to', 'shall']):
-            requirements.append(sentence)
-    
-    return requirements
+    return tuple(match.group().strip() for match in _REQUIREMENT_SENTENCE_RE.finditer(text))
 
 
+@lru_cache(maxsize=2048)
 def determine_priority_from_text(feature: str) -> int:
-    """Determine priority based on feature type and business context"""
+    """Determine priority based on feature type and business context (cached per feature)"""
     feature = clean_text(feature)
     feature_lower = feature.lower()
     
     # High priority features
-    if any(keyword in feature_lower for keyword in ['security', 'authentication', 'data', 'database']):
+    if _HIGH_PRIORITY_RE.search(feature_lower):
         return 3
     
     # Medium priority (default for most features)
@@ -124,51 +220,44 @@ def detect_dependency_chain(text: str) -> Dict[str, Any]:
         - root_concept: str for the Epic title
         - steps: List[str] of dependent tasks in order
     """
-    import re
-    
+    is_chain, root_concept, steps = _detect_dependency_chain(text)
+    return {
+        'is_chain': is_chain,
+        'root_concept': root_concept,
+        'steps': list(steps)
+    }
+
+
+@text_lru_cache(maxsize=512)
+def _detect_dependency_chain(text: str) -> Tuple[bool, str, Tuple[str, ...]]:
+    """Cached chain detection; returns (is_chain, root_concept, steps) so cached results can't be mutated"""
     text_clean = clean_text(text).lower()
     
-    # Common dependency chain indicators - more flexible patterns
-    chain_patterns = [
-        r'([a-zA-Z][a-zA-Z\s]+?)\s*→\s*([a-zA-Z][a-zA-Z\s]+?)\s*→\s*([a-zA-Z][a-zA-Z\s]+)',  # A → B → C
-        r'([a-zA-Z][a-zA-Z\s]+?)\s*->\s*([a-zA-Z][a-zA-Z\s]+?)\s*->\s*([a-zA-Z][a-zA-Z\s]+)',  # A -> B -> C
-        r'([a-zA-Z][a-zA-Z\s]+?)\s+to\s+([a-zA-Z][a-zA-Z\s]+?)\s+to\s+([a-zA-Z][a-zA-Z\s]+)',  # A to B to C
-        r'([a-zA-Z][a-zA-Z\s]+?)\s+then\s+([a-zA-Z][a-zA-Z\s]+?)\s+then\s+([a-zA-Z][a-zA-Z\s]+)',  # A then B then C
-        r'([a-zA-Z][a-zA-Z\s]+?)\s+leads\s+to\s+([a-zA-Z][a-zA-Z\s]+?)\s+leads\s+to\s+([a-zA-Z][a-zA-Z\s]+)'  # A leads to B leads to C
-    ]
-    
-    # Check for sequential workflow patterns
-    for pattern in chain_patterns:
-        match = re.search(pattern, text_clean)
-        if match:
-            steps = [step.strip().title() for step in match.groups()]
-            return {
-                'is_chain': True,
-                'root_concept': f"{steps[0]} to {steps[-1]} Workflow",
-                'steps': steps
-            }
+    # Check for sequential workflow patterns, searching only those whose connector is present
+    for connector, pattern in _CHAIN_PATTERNS:
+        if connector in text_clean:
+            match = pattern.search(text_clean)
+            if match:
+                steps = tuple(step.strip().title() for step in match.groups())
+                return True, f"{steps[0]} to {steps[-1]} Workflow", steps
     
     # Check for common workflow keywords that indicate dependencies
-    workflow_terms = ['database', 'website', 'frontend', 'backend', 'api', 'server']
-    found_terms = [term for term in workflow_terms if term in text_clean]
+    found_terms = {term for term in WORKFLOW_TERMS if term in text_clean}
     
     if len(found_terms) >= 2:
         # If we have multiple workflow components, treat as dependency chain
         # Order them logically: Database → Backend/API → Frontend → Website
-        ordered_terms = []
-        for term in ['database', 'api', 'server', 'backend', 'frontend', 'website']:
-            if term in found_terms:
-                ordered_terms.append(term.title())
+        ordered_terms = [term.title() for term in WORKFLOW_TERM_ORDER if term in found_terms]
         
         if len(ordered_terms) >= 2:
-            return {
-                'is_chain': True,
-                'root_concept': f"{ordered_terms[0]} to {ordered_terms[-1]} System",
-                'steps': ordered_terms
-            }
+            return True, f"{ordered_terms[0]} to {ordered_terms[-1]} System", tuple(ordered_terms)
     
-    return {
-        'is_chain': False,
-        'root_concept': '',
-        'steps': []
-    }
+    return False, '', ()
+
+
+def clear_caches() -> None:
+    """Clear all memoized text analysis results (e.g. between tests)"""
+    _extract_features.cache_clear()
+    _extract_requirements.cache_clear()
+    determine_priority_from_text.cache_clear()
+    _detect_dependency_chain.cache_clear()
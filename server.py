@@ -14,24 +14,61 @@ arrow parsing to create proper Epic → Task hierarchies from visual documentati
 
 import argparse
 import json
-import os
+import logging
+from itertools import chain, islice
 import fastmcp
 from pathlib import Path
-import base64
 
 # Import modules
-from modules.config import setup_environment, get_organization_context, get_azure_openai_config
-from modules.text_processor import extract_features_from_text, extract_requirements_from_text, determine_priority_from_text
-from modules.image_processor import process_image_with_azure_openai, load_image_as_base64, get_azure_openai_client, format_image_analysis_result
-from modules.ado_generator import generate_ado_instructions, format_ado_summary, create_epic_from_feature, create_task_from_requirement
-from modules.file_search import search_files_for_processing, format_search_results_for_display, get_search_usage_examples
-from modules.error_handling import safe_json_response, safe_operation, handle_import_error, validate_json_structure, safe_file_operation, standardize_error_response, retry_operation, ValidationError
-from modules.common_utils import safe_json_dumps, clean_text
-from modules.models import WorkItem, WorkItemType, Priority, ADOInstructions, ORGANIZATION_CONTEXT
-from modules.display_utils import print_ado_summary, get_quick_stats
-
-
-def process_text_input(text: str, project_name: str = "Text Analysis Project") -> dict:
+from modules.config import setup_environment, log_azure_config_status
+from modules.text_processor import extract_features_from_text, extract_features_from_texts
+from modules.image_processor import process_image_with_azure_openai, load_image_as_base64, is_azure_openai_configured
+from modules.ado_generator import generate_ado_instructions, format_ado_summary
+# Aliased because the MCP tool below is registered under the same name
+from modules.file_search import search_files_for_processing as find_files_for_processing
+from modules.error_handling import safe_json_response, ValidationError
+from modules.models import ADOInstructions, ORGANIZATION_CONTEXT
+from modules.display_utils import print_ado_summary
+from modules.common_utils import fast_json_dumps, fast_json_loads, run_in_thread
+
+# Required fields for validate_ado_structure, in the order issues are reported
+REQUIRED_FIELDS = ('project_name', 'epics')
+REQUIRED_EPIC_FIELDS = ('title', 'description', 'tasks')
+REQUIRED_TASK_FIELDS = ('title', 'description', 'work_item_type')
+
+# Set views of the above for a single subset check on items that are complete
+_REQUIRED_FIELD_SET = frozenset(REQUIRED_FIELDS)
+_REQUIRED_EPIC_FIELD_SET = frozenset(REQUIRED_EPIC_FIELDS)
+_REQUIRED_TASK_FIELD_SET = frozenset(REQUIRED_TASK_FIELDS)
+
+# Project types listed by get_organization_context
+COMMON_PROJECTS = (
+    'Web Application Development',
+    'API Development and Integration',
+    'Database Design and Optimization',
+    'Mobile Application Development',
+    'Cloud Infrastructure Setup',
+    'DevOps Pipeline Implementation',
+    'Security Compliance',
+    'Performance Monitoring',
+    'User Experience Enhancement',
+    'Data Analytics and Reporting',
+    'Automated Testing Framework',
+    'Documentation',
+    'Code Review and Optimization'
+)
+
+# The organization context is fixed for the life of the process, so the
+# get_organization_context response is serialized once at import
+_ORGANIZATION_CONTEXT_JSON = fast_json_dumps({
+    'organization': ORGANIZATION_CONTEXT['name'],
+    'platform': ORGANIZATION_CONTEXT['platform'],
+    'focus_areas': ORGANIZATION_CONTEXT['focus_areas'],
+    'methodology': ORGANIZATION_CONTEXT['methodology'],
+    'common_projects': COMMON_PROJECTS
+})
+
+def process_text_input(text: str, project_name: str = "Text Analysis Project") -> ADOInstructions:
     """
     Process text input and generate ADO work items
     
@@ -40,23 +77,25 @@ def process_text_input(text: str, project_name: str = "Text Analysis Project") -
         project_name: Optional project name
         
     Returns:
-        Dictionary containing ADO instructions
+        ADOInstructions ready to be serialized by safe_json_response
     """
     features = extract_features_from_text(text)
-    instructions = generate_ado_instructions(
+    return generate_ado_instructions(
         text_input=text,
         project_name=project_name,
         features=features
     )
-    return instructions.to_dict()
 
 
+logger = logging.getLogger(__name__)
+
 # Initialize environment and MCP server
 setup_environment()
 mcp = fastmcp.FastMCP("ADO Instructions Server")
 
 
 @mcp.tool()
+@run_in_thread
 @safe_json_response
 def process_meeting_transcript(transcript: str) -> dict:
     """
@@ -87,7 +126,36 @@ def process_meeting_transcript(transcript: str) -> dict:
 
 
 @mcp.tool()
-@safe_json_response  
+@run_in_thread
+@safe_json_response
+def process_meeting_transcripts_batch(transcripts: list[str]) -> dict:
+    """
+    Process several meeting transcripts or notes in one call.
+    
+    Args:
+        transcripts: List of meeting transcripts, notes, or requirements documents
+        
+    Returns:
+        JSON string with one set of ADO work item instructions per transcript, in input order
+    """
+    features_per_transcript = extract_features_from_texts(transcripts)
+    results = [
+        generate_ado_instructions(
+            text_input=transcript,
+            project_name="Meeting Transcript Analysis",
+            features=features
+        )
+        for transcript, features in zip(transcripts, features_per_transcript)
+    ]
+    return {
+        "transcripts_processed": len(results),
+        "results": results
+    }
+
+
+@mcp.tool()
+@run_in_thread
+@safe_json_response
 def generate_ado_workitems_from_text(
     text_input: str, 
     project_name: str = "", 
@@ -127,7 +195,7 @@ def generate_ado_workitems_from_text(
     # Display summary for immediate feedback
     print_ado_summary(instructions, "Text Analysis Results")
     
-    return instructions.to_dict()
+    return instructions
 
 
 @mcp.tool()
@@ -158,44 +226,56 @@ def validate_ado_structure(instructions_json: str) -> str:
            ✅ Valid structure with 3 tasks
     """
     try:
-        data = json.loads(instructions_json)
+        data = fast_json_loads(instructions_json)
         issues = []
         
-        # Check required fields
-        required_fields = ['project_name', 'epics']
-        for field in required_fields:
-            if field not in data:
-                issues.append(f"Missing required field: {field}")
+        # Valid JSON of the wrong shape is a structural issue, not a validation error
+        if not isinstance(data, dict):
+            return fast_json_dumps({"valid": False, "issues": ["Instructions must be a JSON object"]})
+        
+        # Check required fields; complete items pass a single subset check
+        if not _REQUIRED_FIELD_SET <= data.keys():
+            issues.extend(f"Missing required field: {field}" for field in REQUIRED_FIELDS if field not in data)
         
         # Check epics structure
-        if 'epics' in data:
-            for i, epic in enumerate(data['epics']):
-                epic_required = ['title', 'description', 'tasks']
-                for field in epic_required:
-                    if field not in epic:
-                        issues.append(f"Epic {i+1} missing field: {field}")
+        epics = data.get('epics')
+        if epics is not None and not isinstance(epics, list):
+            issues.append("Field 'epics' must be a list")
+        elif epics:
+            for i, epic in enumerate(epics, 1):
+                if not isinstance(epic, dict):
+                    issues.append(f"Epic {i} must be an object")
+                    continue
+                if not _REQUIRED_EPIC_FIELD_SET <= epic.keys():
+                    issues.extend(f"Epic {i} missing field: {field}" for field in REQUIRED_EPIC_FIELDS if field not in epic)
                 
                 # Check tasks
-                if 'tasks' in epic:
-                    for j, task in enumerate(epic['tasks']):
-                        task_required = ['title', 'description', 'work_item_type']
-                        for field in task_required:
-                            if field not in task:
-                                issues.append(f"Epic {i+1}, Task {j+1} missing field: {field}")
+                tasks = epic.get('tasks')
+                if tasks is not None and not isinstance(tasks, list):
+                    issues.append(f"Epic {i} field 'tasks' must be a list")
+                elif tasks:
+                    for j, task in enumerate(tasks, 1):
+                        if not isinstance(task, dict):
+                            issues.append(f"Epic {i}, Task {j} must be an object")
+                        elif not _REQUIRED_TASK_FIELD_SET <= task.keys():
+                            issues.extend(
+                                f"Epic {i}, Task {j} missing field: {field}"
+                                for field in REQUIRED_TASK_FIELDS if field not in task
+                            )
         
         if issues:
             result = {"valid": False, "issues": issues}
         else:
             result = {"valid": True, "message": "ADO structure is valid"}
             # Display summary for valid structures
-            print_ado_summary(instructions_json, "Validation Results")
+            print_ado_summary(data, "Validation Results")
             
-        return json.dumps(result, indent=2)
+        return fast_json_dumps(result)
             
     except json.JSONDecodeError as e:
-        return json.dumps({"valid": False, "issues": [f"Invalid JSON: {str(e)}"]}, indent=2)
+        return fast_json_dumps({"valid": False, "issues": [f"Invalid JSON: {str(e)}"]})
     except Exception as e:
-        return json.dumps({"valid": False, "issues": [f"Validation error: {str(e)}"]}, indent=2)
+        return fast_json_dumps({"valid": False, "issues": [f"Validation error: {str(e)}"]})
 
 
 @mcp.tool()
@@ -209,44 +289,18 @@ def get_organization_context() -> str:
     Example Output Structure:
         {
           "organization": "Omar Solutions",
-          "industry": "Software Development & Technology Consulting",
-          "focus_areas": ["Web Development", "Cloud Solutions", "API Integration"],
+          "platform": "Azure Cloud Platform",
+          "focus_areas": ["Data Engineering", "Visualization", "Analytics"],
+          "methodology": "Agile development with Epic/Task hierarchy",
           "common_projects": [
             "Web Application Development",
             "API Development and Integration", 
             "Database Design and Optimization",
             "Mobile Application Development"
-          ],
-          "typical_epic_categories": [
-            "Frontend Development",
-            "Backend API Development", 
-            "Database Infrastructure",
-            "Testing & Quality Assurance"
           ]
         }
     """
-    context = {
-        'organization': ORGANIZATION_CONTEXT['organization'],
-        'industry': ORGANIZATION_CONTEXT['industry'],
-        'focus_areas': ORGANIZATION_CONTEXT['focus_areas'],
-        'common_projects': [
-            'Web Application Development',
-            'API Development and Integration',
-            'Database Design and Optimization',
-            'Mobile Application Development',
-            'Cloud Infrastructure Setup',
-            'DevOps Pipeline Implementation',
-            'Security Compliance',
-            'Performance Monitoring',
-            'User Experience Enhancement',
-            'Data Analytics and Reporting',
-            'Automated Testing Framework',
-            'Documentation',
-            'Code Review and Optimization'
-        ]
-    }
-    
-    return json.dumps(context, indent=2)
+    return _ORGANIZATION_CONTEXT_JSON
 
 
 @mcp.tool()
@@ -291,12 +345,14 @@ def format_ado_instructions_summary(instructions_json: str) -> str:
            └── 3. Product Management API [Medium Priority]
     """
     try:
+        # Parse once and share the instructions with the console summary
+        instructions = ADOInstructions.from_dict(fast_json_loads(instructions_json))
+        
         # Use display utility to print formatted summary
-        print_ado_summary(instructions_json, "ADO Instructions Summary")
+        print_ado_summary(instructions, "ADO Instructions Summary")
         
         # Also return formatted summary
-        data = json.loads(instructions_json)
-        summary = format_ado_summary(data)
+        summary = format_ado_summary(instructions)
         return summary
         
     except json.JSONDecodeError as e:
@@ -306,6 +362,7 @@ def format_ado_instructions_summary(instructions_json: str) -> str:
 
 
 @mcp.tool()
+@run_in_thread
 def search_files_for_processing(
     search_pattern: str = "", 
     file_types: str = "images,text", 
@@ -345,35 +402,36 @@ def search_files_for_processing(
         }
     """
     try:
-        results = search_files_for_processing(search_pattern, file_types, search_locations)
+        results = find_files_for_processing(search_pattern, file_types, search_locations)
         
-        # If results are extensive, provide a summary
-        if len(results.get('found_files', [])) > 20:
-            return json.dumps({
+        # If results are extensive, serialize only a summary instead of the full lists
+        total_found = results['search_summary']['total_found']
+        if total_found > 20:
+            results = {
                 'search_summary': results['search_summary'],
-                'total_files': len(results['found_files']),
-                'first_10_files': results['found_files'][:10],
+                'total_files': total_found,
+                'first_10_files': list(islice(chain(results['images'], results['text_files']), 10)),
                 'suggestions': [
                     'Use a more specific search pattern to narrow results',
                     'Try searching in specific locations only',
                     'Use "all" for file_types or search_locations to expand search'
-                ],
-                'search_summary': results['search_summary']
-            }, indent=2)
+                ]
+            }
         
-        return json.dumps(results, indent=2)
+        return fast_json_dumps(results)
         
     except Exception as e:
-        return json.dumps({
+        return fast_json_dumps({
             'error': f'Error searching files: {str(e)}',
             'search_pattern': search_pattern,
             'file_types': file_types,
             'search_locations': search_locations
-        }, indent=2)
+        })
 
 
 @mcp.tool()
-@safe_json_response  
+@run_in_thread
+@safe_json_response
 def process_feature_image(image_base64: str, description: str = "") -> dict:
     """
     Process an image (wireframe, diagram, sketch) to generate ADO work item instructions using Azure OpenAI.
@@ -387,7 +445,7 @@ def process_feature_image(image_base64: str, description: str = "") -> dict:
     - Workflow diagrams with dependency arrows (→, ←, ↓, ↑)
 
     Args:
-        image_base64: Base64 encoded image data (use load_image_from_file to convert files)
+        image_base64: Base64 encoded image data or a data URL (use load_image_from_file to convert files)
         description: Optional description or context about the image to enhance analysis
         
     Returns:
@@ -414,18 +472,17 @@ def process_feature_image(image_base64: str, description: str = "") -> dict:
         ✅ SUCCESS: Proper dependency structure (1 Epic with dependent tasks)
     """
     try:
-        # Check if Azure OpenAI is available
-        client = get_azure_openai_client()
-        if not client:
+        logger.debug("Received image payload of %d KB", len(image_base64) >> 10)
+        
+        # Check if Azure OpenAI is available without building a throwaway client
+        if not is_azure_openai_configured():
             return {
                 "error": "Azure OpenAI not configured. Please check your .env file configuration.",
                 "fallback": "Use text-based tools for processing requirements."
             }
             
         # Process image with Azure OpenAI
-        ado_instructions = process_image_with_azure_openai(image_base64, description)
-        
-        return ado_instructions.to_dict()
+        return process_image_with_azure_openai(image_base64, description)
         
     except ValidationError as e:
         return {"error": str(e)}
@@ -434,6 +491,7 @@ def process_feature_image(image_base64: str, description: str = "") -> dict:
 
 
 @mcp.tool()
+@run_in_thread
 def load_image_from_file(image_path: str) -> str:
     """
     Load an image file and convert it to base64 for analysis.
@@ -455,7 +513,7 @@ def load_image_from_file(image_path: str) -> str:
     """
     try:
         if not image_path:
-            return json.dumps({"error": "Image path is required"})
+            return fast_json_dumps({"error": "Image path is required"})
             
         # Convert to absolute path
         image_path = str(Path(image_path).resolve())
@@ -463,7 +521,7 @@ def load_image_from_file(image_path: str) -> str:
         # Load and convert image
         base64_data = load_image_as_base64(image_path)
         
-        return json.dumps({
+        return fast_json_dumps({
             "success": True,
             "image_base64": base64_data,
             "image_path": image_path,
@@ -471,9 +529,9 @@ def load_image_from_file(image_path: str) -> str:
         })
         
     except ValidationError as e:
-        return json.dumps({"error": str(e)})
+        return fast_json_dumps({"error": str(e)})
     except Exception as e:
-        return json.dumps({"error": f"Failed to load image: {str(e)}"})
+        return fast_json_dumps({"error": f"Failed to load image: {str(e)}"})
 
 
 if __name__ == "__main__":
@@ -493,6 +551,7 @@ if __name__ == "__main__":
         print("�️ Text and Image Processing with Azure OpenAI")
         print("\nAvailable tools:")
         print("   - process_meeting_transcript") 
+        print("   - process_meeting_transcripts_batch")
         print("   - process_feature_image (🆕 Azure OpenAI)")
         print("   - generate_ado_workitems_from_text")
         print("   - validate_ado_structure")
@@ -501,12 +560,8 @@ if __name__ == "__main__":
         print("   - get_organization_context")
         print("   - load_image_from_file (🆕)")
         
-        # Check Azure OpenAI configuration
-        config = get_azure_openai_config()
-        if config.get('endpoint') and config.get('api_key'):
-            print("✅ Azure OpenAI configured - Image processing available")
-        else:
-            print("⚠️ Azure OpenAI not configured - Text processing only")
+        # Check Azure OpenAI configuration (prints its own status line)
+        log_azure_config_status()
         
         import uvicorn
         app = mcp.http_app()
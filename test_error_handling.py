@@ -0,0 +1,25 @@
+#!/usr/bin/env python3
+"""
+Tests for the shared error handling decorators
+"""
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add current directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from modules.error_handling import OperationError, safe_operation
+
+
+def test_safe_operation_raises_operation_error():
+    """Failures surface as OperationError carrying the operation name and cause"""
+    @safe_operation("diagram parsing")
+    def fail():
+        raise ValueError("bad diagram")
+
+    with pytest.raises(OperationError) as excinfo:
+        fail()
+    assert excinfo.value.operation == "diagram parsing"
+    assert isinstance(excinfo.value.cause, ValueError)
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Tests for searching processable files in the standard locations
+"""
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add current directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from modules import file_search
+from modules.file_search import invalidate_search_cache, search_files_for_processing
+
+
+@pytest.fixture
+def home(tmp_path, monkeypatch):
+    """Fake home folder with Desktop and Documents, used as the working directory"""
+    for folder in ('Desktop', 'Documents'):
+        (tmp_path / folder).mkdir()
+    monkeypatch.setattr(file_search, '_HOME_LOCATIONS', {
+        'desktop': tmp_path / 'Desktop',
+        'documents': tmp_path / 'Documents',
+        'downloads': tmp_path / 'Downloads',
+    })
+    monkeypatch.chdir(tmp_path)
+    invalidate_search_cache()
+    yield tmp_path
+    invalidate_search_cache()
+
+
+def test_nested_location_keeps_its_own_label(home):
+    """Files in a location inside another selected one are reported once, under the inner location"""
+    (home / 'Desktop' / 'wireframe.png').write_bytes(b'png')
+    (home / 'notes.txt').write_text('notes')
+
+    results = search_files_for_processing('', 'all', 'desktop,current')
+
+    assert [(f['name'], f['location']) for f in results['images']] == [('wireframe.png', 'desktop')]
+    assert [(f['name'], f['location']) for f in results['text_files']] == [('notes.txt', 'current')]
+    assert results['search_summary']['locations_searched'] == ['desktop', 'current']
+    assert results['search_summary']['total_found'] == 2
+
+
+def test_missing_locations_are_not_reported_as_searched(home):
+    """Locations that don't exist are left out of locations_searched"""
+    results = search_files_for_processing('', 'all', 'documents,downloads')
+
+    assert results['search_summary']['locations_searched'] == ['documents']
+
+
+def test_wildcard_pattern_with_folder_matches_relative_path(home):
+    """Patterns naming a folder match the path below the location, like a recursive glob"""
+    (home / 'Documents' / 'TestImages').mkdir()
+    (home / 'Documents' / 'TestImages' / 'diagram.JPG').write_bytes(b'jpg')
+    (home / 'Documents' / 'other.jpg').write_bytes(b'jpg')
+
+    for pattern in ('TestImages/*.jpg', 'TestImages\\*.jpg'):
+        invalidate_search_cache()
+        results = search_files_for_processing(pattern, 'images', 'documents')
+        assert [f['name'] for f in results['images']] == ['diagram.JPG']
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Tests for Azure OpenAI image analysis, using a fake streaming client
+"""
+import json
+import logging
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+# Add current directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from modules.image_processor import analyze_image_with_azure_openai, extract_features_from_image
+
+IMAGE_BASE64 = "iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAYAAAAfFcSJAAAADUlEQVR42mNk"
+
+
+class FakeStream:
+    """Iterable, closable stream of chat completion chunks"""
+
+    def __init__(self, chunks):
+        self.chunks = chunks
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def __iter__(self):
+        return iter(self.chunks)
+
+
+def fake_client(content: str, chunk_size: int = 7):
+    """Client whose completions stream content, a finish chunk, then the usage chunk"""
+    chunks = [
+        SimpleNamespace(usage=None, choices=[SimpleNamespace(delta=SimpleNamespace(content=content[i:i + chunk_size]))])
+        for i in range(0, len(content), chunk_size)
+    ]
+    chunks.append(SimpleNamespace(usage=None, choices=[SimpleNamespace(delta=SimpleNamespace(content=None))]))
+    usage = SimpleNamespace(prompt_tokens=1200, prompt_tokens_details=SimpleNamespace(cached_tokens=1024))
+    chunks.append(SimpleNamespace(usage=usage, choices=[]))
+    create = lambda **kwargs: FakeStream(chunks)
+    return SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
+
+
+ANALYSIS = {
+    "project_name": "Website",
+    "workflow_analysis": {
+        "arrows_detected": True,
+        "main_workflow_start": "Database",
+        "dependency_sequence": ["Database", "Backend"],
+        "flow_direction": "left-to-right"
+    },
+    "features": [],
+    "analysis_notes": "Braces in strings: {not structure}"
+}
+
+
+def test_analysis_is_parsed_and_usage_logged(caplog):
+    """The JSON object is parsed and the trailing usage chunk is still read"""
+    with caplog.at_level(logging.DEBUG, logger="modules.image_processor"):
+        result = analyze_image_with_azure_openai(IMAGE_BASE64, client=fake_client(json.dumps(ANALYSIS)))
+
+    assert result["project_name"] == "Website"
+    assert result["analysis_notes"] == ANALYSIS["analysis_notes"]
+    assert "Prompt tokens: 1200 (1024 cached)" in caplog.text
+
+
+def test_extracted_requirements_are_upgraded_to_high():
+    """Medium requirements the text classifier rates high priority become High"""
+    requirements = [
+        {"title": "Schema", "description": "Design the database schema", "priority": "Medium"},
+        {"title": "Footer", "description": "Add a footer", "priority": "Medium"},
+        {"title": "Logo", "description": "Update the database logo", "priority": "Low"},
+    ]
+    analysis = {**ANALYSIS, "features": [{"name": "Storage", "requirements": requirements}]}
+
+    features = extract_features_from_image(IMAGE_BASE64, client=fake_client(json.dumps(analysis)))
+
+    assert [req["priority"] for req in features[0]["requirements"]] == ["High", "Medium", "Low"]
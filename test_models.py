@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+Tests for building work items and instructions from dictionaries
+"""
+import sys
+from pathlib import Path
+
+# Add current directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from modules.ado_generator import generate_ado_instructions
+from modules.models import ORGANIZATION_CONTEXT, ADOInstructions, Priority, WorkItem, WorkItemType
+
+
+def test_flat_format_round_trips():
+    """Instructions rebuilt from to_dict match the generated ones"""
+    instructions = generate_ado_instructions("Build a login page. Add a reporting dashboard.", "Portal")
+
+    assert ADOInstructions.from_dict(instructions.to_dict()) == instructions
+
+
+def test_nested_format_gets_positional_ids():
+    """Epics and their tasks are flattened, with tasks linked to their epic"""
+    instructions = ADOInstructions.from_dict({
+        "project_name": "Shop",
+        "epics": [
+            {"title": "Backend", "priority": "High", "tasks": [{"title": "Schema"}, {"title": "API"}]},
+            {"id": "web", "title": "Frontend", "tasks": [{"title": "Cart"}]},
+        ]
+    })
+
+    assert [(item.id, item.work_item_type, item.parent_id) for item in instructions.work_items] == [
+        ("epic-1", WorkItemType.EPIC, None),
+        ("epic-1-task-1", WorkItemType.TASK, "epic-1"),
+        ("epic-1-task-2", WorkItemType.TASK, "epic-1"),
+        ("web", WorkItemType.EPIC, None),
+        ("web-task-1", WorkItemType.TASK, "web"),
+    ]
+    assert instructions.work_items[0].priority is Priority.HIGH
+    assert instructions.organization_context == ORGANIZATION_CONTEXT
+
+
+def test_unknown_type_and_priority_fall_back_to_defaults():
+    """Unrecognized values become a Medium priority Task"""
+    item = WorkItem.from_dict({"title": "Spike", "work_item_type": "Feature", "priority": "Urgent"})
+
+    assert item.work_item_type is WorkItemType.TASK
+    assert item.priority is Priority.MEDIUM
+    assert (item.id, item.description, item.tags, item.parent_id) == ("", "", [], None)
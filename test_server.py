@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Tests for the MCP tools, called through an in-memory FastMCP client
+"""
+import asyncio
+import json
+import sys
+from pathlib import Path
+
+from fastmcp import Client
+
+# Add current directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+import server
+from modules import file_search
+from modules.file_search import invalidate_search_cache
+
+NESTED_INSTRUCTIONS = {
+    "project_name": "Shop",
+    "epics": [{"title": "Backend", "priority": "High", "tasks": [{"title": "Schema"}, {"title": "API"}]}]
+}
+
+
+def call_tool(name: str, arguments: dict) -> str:
+    """Call a tool on the server and return its text result"""
+    async def call():
+        async with Client(server.mcp) as client:
+            return await client.call_tool(name, arguments)
+
+    return asyncio.run(call()).content[0].text
+
+
+def test_summary_accepts_nested_epics():
+    """Instructions in the nested epics format are summarized, not rejected"""
+    summary = call_tool("format_ado_instructions_summary", {"instructions_json": json.dumps(NESTED_INSTRUCTIONS)})
+
+    assert "🎯 Project: Shop" in summary
+    assert "• 1 Epic(s)" in summary
+    assert "• 2 Task(s)" in summary
+
+
+def test_priority_override_is_matched_by_name():
+    """Overrides apply whatever their case; unknown values leave priorities alone"""
+    text = "Build a login page. Add a reporting dashboard."
+    overridden = json.loads(call_tool("generate_ado_workitems_from_text", {"text_input": text, "priority_override": "critical"}))
+    unchanged = json.loads(call_tool("generate_ado_workitems_from_text", {"text_input": text, "priority_override": "urgent"}))
+
+    assert {item["priority"] for item in overridden["work_items"]} == {"Critical"}
+    assert "Critical" not in {item["priority"] for item in unchanged["work_items"]}
+
+
+def test_search_tool_returns_results(tmp_path, monkeypatch):
+    """The tool searches the file system rather than calling itself"""
+    (tmp_path / "Desktop").mkdir()
+    (tmp_path / "Desktop" / "wireframe.png").write_bytes(b"png")
+    monkeypatch.setattr(file_search, "_HOME_LOCATIONS", {"desktop": tmp_path / "Desktop"})
+    invalidate_search_cache()
+    try:
+        results = json.loads(call_tool("search_files_for_processing", {"search_locations": "desktop"}))
+    finally:
+        invalidate_search_cache()
+
+    assert [f["name"] for f in results["images"]] == ["wireframe.png"]
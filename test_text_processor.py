@@ -0,0 +1,23 @@
+#!/usr/bin/env python3
+"""
+Tests for text feature and requirement extraction
+"""
+import sys
+from pathlib import Path
+
+# Add current directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from modules.text_processor import extract_requirements_from_text
+
+
+def test_requirements_split_on_all_sentence_endings():
+    """Requirements end at '!' and '?' as well as '.'"""
+    text = "Is it urgent? The API must be fast! Users should log in. Great"
+    assert extract_requirements_from_text(text) == ["The API must be fast", "Users should log in"]
+
+
+def test_requirements_skip_sentences_without_triggers():
+    """Sentences without a requirement trigger are not returned"""
+    assert extract_requirements_from_text("Nice weather. We had lunch!") == []
+    assert extract_requirements_from_text("") == []